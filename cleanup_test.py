@@ -7,11 +7,35 @@ import time
 import signal
 import sys
 import threading
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
 from scanner.input_manager import InputManager
 from scanner.op25_manager import OP25Manager
 from scanner.display_manager import DisplayManager
 from scanner.settings_manager import SettingsManager
 
+# Per-step budget in seconds for each cleanup call
+STEP_TIMEOUT = 10
+STEP_THREAD_PREFIX = "cleanup-step"
+
+
+def run_step(name, func, timeout):
+    """Run func on a daemon thread and return its result, waiting at most timeout.
+
+    Raises concurrent.futures.TimeoutError if the step hangs. The thread is a
+    daemon (unlike ThreadPoolExecutor workers) so a hung step can't also block
+    interpreter exit.
+    """
+    fut = Future()
+
+    def runner():
+        try:
+            fut.set_result(func())
+        except BaseException as e:
+            fut.set_exception(e)
+
+    threading.Thread(target=runner, name=f"{STEP_THREAD_PREFIX}: {name}", daemon=True).start()
+    return fut.result(timeout=timeout)
+
 def test_cleanup():
     """Test the cleanup sequence in isolation"""
     print("Testing cleanup sequence...")
@@ -23,60 +47,55 @@ def test_cleanup():
     display = DisplayManager()
     
     print("Components initialized")
-    
-    # Test cleanup with timeout
-    def cleanup_with_timeout():
-        print("Starting cleanup sequence...")
-        start_time = time.time()
-        
+
+    def display_cleanup():
+        display.cleanup()
+        display.clear()
+
+    # Each step gets its own time budget so one hang doesn't eat the others'
+    steps = [
+        ("Stopping OP25 manager", op25_manager.cleanup),
+        ("Cleaning up input manager", input_mgr.cleanup),
+        ("Cleaning up display", display_cleanup),
+    ]
+
+    print("Starting cleanup sequence...")
+    start_time = time.time()
+    success = True
+    for i, (name, func) in enumerate(steps, 1):
+        print(f"{i}. {name}...")
+        step_time = time.time()
         try:
-            print("1. Stopping OP25 manager...")
-            op25_manager.cleanup()
-            print(f"   OP25 manager cleanup completed in {time.time() - start_time:.2f}s")
-            
-            print("2. Cleaning up input manager...")
-            step_time = time.time()
-            input_mgr.cleanup()
-            print(f"   Input manager cleanup completed in {time.time() - step_time:.2f}s")
-            
-            print("3. Cleaning up display...")
-            step_time = time.time()
-            display.cleanup()
-            display.clear()
-            print(f"   Display cleanup completed in {time.time() - step_time:.2f}s")
-            
-            total_time = time.time() - start_time
-            print(f"Total cleanup time: {total_time:.2f}s")
-            return True
-            
+            run_step(name, func, STEP_TIMEOUT)
+            print(f"   Completed in {time.time() - step_time:.2f}s")
+        except FuturesTimeoutError:
+            print(f"ERROR: '{name}' is hanging! Did not complete within {STEP_TIMEOUT}s.")
+            print("This indicates a potential issue with this cleanup method.")
+            success = False
         except Exception as e:
-            print(f"ERROR during cleanup: {e}")
-            return False
-    
-    # Run cleanup with a timeout to detect hangs
-    cleanup_thread = threading.Thread(target=cleanup_with_timeout)
-    cleanup_thread.daemon = True
-    cleanup_thread.start()
-    
-    # Wait up to 30 seconds for cleanup
-    cleanup_thread.join(timeout=30)
-    
-    if cleanup_thread.is_alive():
-        print("ERROR: Cleanup is hanging! Thread did not complete within 30 seconds.")
-        print("This indicates a potential issue with one of the cleanup methods.")
+            print(f"ERROR during '{name}': {e}")
+            success = False
+
+    print(f"Total cleanup time: {time.time() - start_time:.2f}s")
+
+    leaked = [t.name for t in threading.enumerate() if t.name.startswith(STEP_THREAD_PREFIX)]
+    if leaked:
+        print(f"ERROR: cleanup threads still running: {', '.join(leaked)}")
         return False
-    else:
+
+    if success:
         print("Cleanup completed successfully!")
-        return True
+    return success
 
 def signal_handler(sig, frame):
-    print("\nInterrupt received, testing cleanup...")
+    print(f"\nSignal {sig} received, testing cleanup...")
     success = test_cleanup()
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
     # Set up signal handler
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
     
     print("Cleanup test ready. Press Ctrl+C to test cleanup sequence.")
     print("Alternatively, the test will run automatically in 5 seconds...")
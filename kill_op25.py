@@ -3,58 +3,114 @@
 Emergency script to kill all OP25 processes
 Run this if you have too many rx.py processes running
 """
+import os
+import re
 import psutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO)
 
-def find_all_op25_processes():
-    """Find ALL OP25 processes"""
-    processes = []
+_HAVE_PROC = os.path.isdir("/proc")
+
+# Matches an argv entry that is (a path to) rx.py or multi_rx.py, tested on the
+# raw NUL-separated /proc/<pid>/cmdline bytes
+_OP25_RE = re.compile(rb"(?:^|[/\x00])(?:multi_)?rx\.py(?:\x00|$)")
+
+# Threads used to overlap the per-PID open()/read() syscalls
+_SCAN_WORKERS = 32
+
+# Seconds to wait after SIGTERM before escalating, and after SIGKILL before giving up
+TERM_GRACE = 3
+KILL_GRACE = 2
+
+
+def _read_cmdline(pid):
+    """Return (pid, raw NUL-separated cmdline bytes), or None if unreadable"""
+    if _HAVE_PROC:
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                return pid, f.read()
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            return None
+    # Non-Linux fallback: let psutil resolve the cmdline for this PID only
     try:
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            if proc.info['name'] and ('multi_rx.py' in proc.info['name'] or 'rx.py' in proc.info['name']):
-                processes.append(proc)
-            elif proc.info['cmdline']:
-                cmdline = ' '.join(proc.info['cmdline'])
-                if ('multi_rx.py' in cmdline or 'rx.py' in cmdline or 
-                    ('python' in cmdline and ('multi_rx.py' in cmdline or 'rx.py' in cmdline))):
-                    processes.append(proc)
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
-        pass
-    return processes
+        return pid, b"\x00".join(arg.encode(errors="ignore") for arg in psutil.Process(pid).cmdline())
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None
+
+
+def find_all_op25_processes():
+    """Find ALL OP25 processes.
+    Returns a list of (psutil.Process, cmdline_bytes) tuples. The Process objects are
+    created as soon as a PID matches, so psutil's create-time check keeps later
+    terminate()/kill() calls from reaching an unrelated process that reused the PID.
+    """
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as ex:
+        results = list(ex.map(_read_cmdline, psutil.pids()))
+    # Filter in the calling thread; unreadable/exited PIDs come back as None
+    matches = []
+    for r in results:
+        if r and _OP25_RE.search(r[1]):
+            try:
+                matches.append((psutil.Process(r[0]), r[1]))
+            except psutil.NoSuchProcess:
+                pass
+    return matches
 
 def kill_all_op25():
     """Kill all OP25 processes"""
     all_procs = find_all_op25_processes()
     killed_count = 0
-    
+
     if not all_procs:
         print("No OP25 processes found")
         return 0
-    
+
     print(f"Found {len(all_procs)} OP25 processes to kill:")
-    for proc in all_procs:
-        try:
-            print(f"  PID {proc.pid}: {' '.join(proc.cmdline())}")
-        except:
-            print(f"  PID {proc.pid}: <unknown command>")
-    
+    for proc, cmdline in all_procs:
+        cmd_text = cmdline.replace(b"\x00", b" ").decode(errors="replace").strip()
+        print(f"  PID {proc.pid}: {cmd_text or '<unknown command>'}")
+
     confirm = input("\nKill all these processes? (y/N): ")
     if confirm.lower() != 'y':
         print("Cancelled")
         return 0
-    
-    print("\nKilling processes...")
-    for proc in all_procs:
+
+    print("\nStopping processes...")
+    # Ask everything to exit first (SIGTERM) so rx.py can shut down cleanly,
+    # then SIGKILL whatever is still around after the grace period
+    procs = []
+    for proc, _ in all_procs:
         try:
-            proc.kill()
-            proc.wait(timeout=5)
-            print(f"✓ Killed PID {proc.pid}")
+            # Raises NoSuchProcess if the PID now belongs to a different process
+            proc.terminate()
+            procs.append(proc)
+        except psutil.NoSuchProcess:
+            print(f"✓ Stopped PID {proc.pid}")
             killed_count += 1
         except Exception as e:
-            print(f"✗ Failed to kill PID {proc.pid}: {e}")
-    
+            print(f"✗ Failed to stop PID {proc.pid}: {e}")
+
+    gone, alive = psutil.wait_procs(
+        procs, timeout=TERM_GRACE, callback=lambda p: print(f"✓ Stopped PID {p.pid}")
+    )
+    killed_count += len(gone)
+
+    if alive:
+        print(f"Escalating to SIGKILL for {len(alive)} process(es)...")
+        for proc in alive:
+            try:
+                proc.kill()
+            except psutil.NoSuchProcess:
+                pass
+        gone, alive = psutil.wait_procs(
+            alive, timeout=KILL_GRACE, callback=lambda p: print(f"✓ Killed PID {p.pid}")
+        )
+        killed_count += len(gone)
+        for proc in alive:
+            print(f"✗ Failed to kill PID {proc.pid}: still running after SIGKILL")
+
     print(f"\nKilled {killed_count} OP25 processes")
     return killed_count
 
@@ -1,21 +1,57 @@
 # --- display_manager.py ---
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageColor, ImageDraw, ImageFont
 import os
-from datetime import datetime
+import json
+import mmap
+import struct
 import time
 import subprocess
-import re
 import logging
+import queue
+import random
+import threading
+from collections import deque
+from functools import lru_cache
+from statistics import median
+from typing import NamedTuple, Optional
+
+# Hardware-specific libraries are optional in dev environments. Blinka's board/busio
+# probe the platform on import, so they are loaded on first use by _import_hardware()
+board = None  # type: ignore
+busio = None  # type: ignore
+adafruit_ssd1306 = None  # type: ignore
+_hardware_imported = False
+
+
+def _import_hardware() -> bool:
+    """Import board, busio and adafruit_ssd1306 once; True if they are usable."""
+    global board, busio, adafruit_ssd1306, _hardware_imported
+    if not _hardware_imported:
+        _hardware_imported = True
+        try:
+            import board as _board  # type: ignore
+            import busio as _busio  # type: ignore
+            import adafruit_ssd1306 as _adafruit_ssd1306  # type: ignore
+
+            board, busio, adafruit_ssd1306 = _board, _busio, _adafruit_ssd1306
+        except Exception as e:
+            logging.debug(f"Hardware libraries not available: {e}")
+    return adafruit_ssd1306 is not None
+
+
+@lru_cache(maxsize=None)
+def _resolve_pin(name):
+    """board.<name> for a pin named in settings (e.g. 'D5') or the I2C bus pins ('SCL', 'SDA'),
+    resolved once per name.
+    An unknown name raises ValueError listing the board's pins instead of silently
+    falling back to a default pin.
+    """
+    pin = getattr(board, str(name), None)
+    if pin is None:
+        pins = sorted(n for n in dir(board) if type(getattr(board, n)).__name__ == "Pin")
+        raise ValueError(f"Unknown board pin {name!r}; available: {', '.join(pins)}")
+    return pin
 
-# Hardware-specific libraries are optional in dev environments
-try:
-    import board  # type: ignore
-    import busio  # type: ignore
-    import adafruit_ssd1306  # type: ignore
-except Exception:
-    board = None  # type: ignore
-    busio = None  # type: ignore
-    adafruit_ssd1306 = None  # type: ignore
 
 try:
     import displayio
@@ -44,14 +80,612 @@ try:
 except Exception:
     RGB_ST7789_AVAILABLE = False
 
+# bitmaptools (CircuitPython / Blinka displayio) fills bitmap regions natively
+try:
+    import bitmaptools  # type: ignore
+except ImportError:
+    bitmaptools = None  # type: ignore
+
+try:
+    import fcntl
+except ImportError:  # non-Unix dev machines
+    fcntl = None  # type: ignore
+
+# pulsectl is optional; it keeps one libpulse connection instead of forking pactl per poll
+try:
+    import pulsectl  # type: ignore
+except ImportError:
+    pulsectl = None  # type: ignore
+
+# pyalsaaudio is optional; reads the ALSA mixer in-process instead of forking amixer
+try:
+    import alsaaudio  # type: ignore
+except ImportError:
+    alsaaudio = None  # type: ignore
+
+# NumPy is optional; when present it packs RGB565 framebuffer frames faster
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None  # type: ignore
+
+# Default TFT font candidates, first existing path wins
+_DEFAULT_FONT_PATHS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+    "/System/Library/Fonts/Arial.ttf",  # macOS
+    "/Windows/Fonts/arial.ttf",  # Windows
+]
+
+
+# Per-channel lookup tables for packing RGB888 into little-endian RGB565
+_RGB565_R_HI = [v & 0xF8 for v in range(256)]
+_RGB565_G_HI = [v >> 5 for v in range(256)]
+_RGB565_G_LO = [(v & 0x1C) << 3 for v in range(256)]
+_RGB565_B_LO = [v >> 3 for v in range(256)]
+# Same packing for a gray level v (r = g = b = v), so "L" frames need no RGB expansion
+_RGB565_GRAY_HI = [(v & 0xF8) | (v >> 5) for v in range(256)]
+_RGB565_GRAY_LO = [((v & 0x1C) << 3) | (v >> 3) for v in range(256)]
+
+
+def _rgb565_bytes(img: Image.Image, big_endian: bool = False) -> bytes:
+    """Convert a PIL image to RGB565 bytes (NumPy if available, else Pillow's C paths).
+    Little-endian suits fbdev; SPI panels (ST7789 RAMWR) take big-endian.
+    """
+    if img.mode == "L":
+        hi, lo = img.point(_RGB565_GRAY_HI), img.point(_RGB565_GRAY_LO)
+        return Image.merge("LA", (hi, lo) if big_endian else (lo, hi)).tobytes()
+    if np is not None:
+        # An RGB image is read as-is: convert() would copy it first even in the same mode
+        rgb = img if img.mode == "RGB" else img.convert("RGB")
+        arr = np.asarray(rgb).reshape(-1, 3).astype(np.uint16)
+        rgb565 = ((arr[:, 0] & 0xF8) << 8) | ((arr[:, 1] & 0xFC) << 3) | (arr[:, 2] >> 3)
+        return rgb565.astype(">u2" if big_endian else "<u2").tobytes()
+    r, g, b = img.convert("RGB").split()
+    # High/low bytes never share bits, so a saturating add acts as a bitwise OR
+    hi = ImageChops.add(r.point(_RGB565_R_HI), g.point(_RGB565_G_HI))
+    lo = ImageChops.add(g.point(_RGB565_G_LO), b.point(_RGB565_B_LO))
+    return Image.merge("LA", (hi, lo) if big_endian else (lo, hi)).tobytes()
+
+
+if np is not None:
+    # Gray level -> native framebuffer pixel, for 16 bpp (RGB565) and 32 bpp (XRGB8888)
+    _FB_GRAY16 = np.array([(hi << 8) | lo for hi, lo in zip(_RGB565_GRAY_HI, _RGB565_GRAY_LO)], dtype=np.uint16)
+    _FB_GRAY32 = np.arange(256, dtype=np.uint32) * 0x010101
+    # Gray level -> big-endian RGB565 as sent to SPI panels
+    _RGB565_GRAY_BE = _FB_GRAY16.astype(">u2")
+
+
+def _fb_pixel_values(img: Image.Image, bpp: int):
+    """(rows, cols) NumPy array of img in the framebuffer's native pixel format."""
+    if img.mode == "L":
+        return (_FB_GRAY16 if bpp == 16 else _FB_GRAY32)[np.asarray(img)]
+    arr = np.asarray(img if img.mode == "RGB" else img.convert("RGB")).astype(np.uint32)
+    r, g, b = arr[..., 0], arr[..., 1], arr[..., 2]
+    if bpp == 16:
+        return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+    return (r << 16) | (g << 8) | b
+
+
+# Volume cache lifetime while nothing is being received; during a call or volume
+# adjustment the configured volume_poll_interval applies instead
+_VOL_IDLE_TTL = 2.0
+
+# Adaptive refresh pacing outside transmissions: the minimum interval between pushes
+# follows half the median gap between the last few content changes, capped at the
+# clock's one-second tick
+_PACE_HISTORY = 8
+_PACE_MAX_INTERVAL = 1.0
+
+# Minimum seconds between status frame dumps to image_path (dump_frame); each dump is
+# a full-frame file write, which on an SD card can take longer than the frame itself
+_DEBUG_DUMP_INTERVAL = 2.0
+
+
+# Shell fallbacks for the system volume, tried in order: PulseAudio, then ALSA
+_VOLUME_CMDS = (
+    ("pactl", "get-sink-volume", "@DEFAULT_SINK@"),
+    ("amixer", "get", "Master"),
+)
+
+
+def _first_percent(out: bytes):
+    """First 'NN%' token in pactl/amixer output (amixer brackets it as '[NN%]'), or None."""
+    for tok in out.split():
+        tok = tok.strip(b"[],")
+        if tok.endswith(b"%") and tok[:-1].isdigit():
+            return int(tok[:-1])
+    return None
+
+
+# linux/fb.h: screen info ioctls. fb_fix_screeninfo is read up to line_length:
+# id[16], smem_start (unsigned long), smem_len, type, type_aux, visual,
+# xpanstep/ypanstep/ywrapstep (u16), line_length; native alignment matches the kernel's
+_FBIOGET_VSCREENINFO = 0x4600
+_FBIOGET_FSCREENINFO = 0x4602
+_FB_FIX_FMT = "16sL4I3HI"
+
+
+def _framebuffer_geometry(fd):
+    """Return (xres, yres, bits_per_pixel, line_length) of a framebuffer fd, or None."""
+    if fcntl is None:
+        return None
+    try:
+        var = fcntl.ioctl(fd, _FBIOGET_VSCREENINFO, bytes(160))
+        fix = fcntl.ioctl(fd, _FBIOGET_FSCREENINFO, bytes(128))
+    except OSError:
+        return None
+    # fb_var_screeninfo starts xres, yres, xres_virtual, yres_virtual, xoffset, yoffset, bits_per_pixel
+    xres, yres, _, _, _, _, bpp = struct.unpack_from("7I", var)
+    line_length = struct.unpack_from(_FB_FIX_FMT, fix)[-1]
+    return xres, yres, bpp, line_length
+
+
+# SSD1306 OLED geometry
+_OLED_WIDTH = 128
+_OLED_HEIGHT = 64
+
+# SSD1306 I2C clock: try Fast-mode Plus, fall back to Fast-mode if the panel errors
+# within its first _OLED_I2C_PROBE_FRAMES pushes
+_OLED_I2C_HZ = 1_000_000
+_OLED_I2C_SAFE_HZ = 400_000
+_OLED_I2C_PROBE_FRAMES = 5
+
+_OLED_PAGES = _OLED_HEIGHT // 8
+
+
+# SSD1306 I2C control byte 0x00 (command stream) followed by the column (0x21) and
+# page (0x22) address windows, sent as one transaction
+def _ssd1306_window_cmds(first_page, last_page):
+    return bytes([0x00, 0x21, 0, _OLED_WIDTH - 1, 0x22, first_page, last_page])
+
+
+# Max characters per text field (slicing already copes with shorter strings)
+_OLED_LINE_CHARS = 21     # 128 px / 6 px per 5x8 glyph
+_OLED_VOL_CHARS = 6
+_TFT_SYSTEM_CHARS = 25    # PIL/displayio system line
+_TFT_DEPT_CHARS = 30
+_TFT_STATUS_CHARS = 30
+_TFT_LINE_CHARS = 35      # tag / NAC-WACN-SYS lines
+_SIGNATURE_SYSTEM_CHARS = 35
+_SIGNATURE_DEPT_CHARS = 40
+
+# Fixed TFT label texts, shared by the canvas, displayio and signature paths so an idle
+# frame hands the same string objects to _set_label()/_tft_band_dirty() every time
+_TFT_SCANNING = "Scanning..."
+_TFT_ENCRYPTED = "Encrypted"
+_TFT_FREQ_NONE = "Freq: --"
+_TFT_NO_SYSTEM = "No System"
+
+
+@lru_cache(maxsize=128)
+def _tft_vol_text(volume):
+    """TFT header volume label ('VOL: 07'), formatted once per level."""
+    return f"VOL: {volume:02d}"
+
+
+def _fit(text, width, default=""):
+    """Truncate text to width characters, substituting default for None/empty."""
+    return text[:width] if text else default
+
+
+_TRANSPOSE = getattr(Image, "Transpose", Image).TRANSPOSE
+
+# adafruit_framebuf's bitmap font, looked up in the working directory first like
+# framebuf.text() does, then next to the scanner package
+_OLED_FONT_PATHS = [
+    "font5x8.bin",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "font5x8.bin"),
+]
+
+
+# 6x8 OLED padlock as MONO_VLSB column bytes (bit 0 = top row): shackle rows 0-2,
+# body outline rows 3-7 with a keyhole at (3, 5)
+_OLED_LOCK_COLUMNS = bytes([0xF8, 0x8E, 0x89, 0xA9, 0x8E, 0xF8])
+_OLED_LOCK_ICON = Image.frombytes("1", (8, 6), _OLED_LOCK_COLUMNS, "raw", "1;R").transpose(_TRANSPOSE)
+
+
+# 1x1 scratch draw used only to measure text exactly as ImageDraw.text lays it out
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("L", (1, 1)))
+
+
+@lru_cache(maxsize=64)
+def _text_width(text, font):
+    """Laid-out pixel width of text (textbbox), measured once per (text, font)."""
+    x0, _, x1, _ = _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+    return x1 - x0
+
+
+@lru_cache(maxsize=256)
+def _text_mask(text, font):
+    """Rasterize text once into a tight 'L' coverage mask; returns (mask, (dx, dy)).
+
+    Pasting the mask at (x + dx, y + dy) reproduces draw.text((x, y), ...) without
+    running FreeType layout again. Fonts are long-lived, so keying on them is safe.
+    """
+    x0, y0, x1, y1 = _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+    mask = Image.new("L", (max(1, x1 - x0), max(1, y1 - y0)), 0)
+    ImageDraw.Draw(mask).text((-x0, -y0), text, fill=255, font=font)
+    return mask, (x0, y0)
+
+
+# The seconds clock never repeats a string, so it gets its own two-entry cache (this
+# second and the last) rather than evicting the recurring label masks. Both the clock
+# cell fit check and the draw read it, so each new time string is laid out and
+# rasterized once
+_transient_mask = lru_cache(maxsize=2)(_text_mask.__wrapped__)
+
+
+# PIL.Image.rotate(angle, expand=True) equivalents, as applied by adafruit_rgb_display.image()
+_ROTATE_TRANSPOSE = {
+    90: Image.Transpose.ROTATE_90,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_270,
+}
+
+# Dirty TFT boxes this close together (in rows) are pushed as one window; a separate
+# window costs an address-setup transaction, a few blank rows cost less
+_TFT_SPAN_MERGE_GAP = 8
+
+# TFT header clock cell: x < this holds only the time text (volume starts here), so a
+# clock-only change redraws and pushes just this corner of the header band
+_TFT_CLOCK_CELL_W = 70
+
+# TFT header signal meter size (outline included)
+_TFT_SIG_W, _TFT_SIG_H = 40, 10
+
+# Fill width in pixels of the 40 px signal meters (OLED, TFT canvas, displayio): 40 less the outline
+_METER_INNER_W = 38
+
+
+def _meter_fill(quality) -> int:
+    """Filled pixels of a signal meter for signal_quality in [0, 1] (clamped; bad values read as 0).
+    The frame key stores this instead of the raw float, so quality jitter that does not move
+    the meter by a pixel does not count as a visible change.
+    """
+    try:
+        q = float(quality or 0.0)
+    except (TypeError, ValueError):
+        return 0
+    if q != q:  # NaN
+        return 0
+    return max(0, min(_METER_INNER_W, int(_METER_INNER_W * max(0.0, min(1.0, q)))))
+
+
+# displayio lock icon (12x12): shackle over a body with a keyhole, '#' = palette index 1
+_LOCK_ICON_W, _LOCK_ICON_H = 12, 12
+_LOCK_ICON_MASK = bytes(
+    ch == "#"
+    for row in (
+        "............",
+        "............",
+        "....#..#....",
+        "...#....#...",
+        "...######...",
+        "..########..",
+        "..#......#..",
+        "..#......#..",
+        "..#...#..#..",
+        "..#......#..",
+        "..########..",
+        "............",
+    )
+    for ch in row
+)
+
+
+# The same icon as an 'L' paste mask for the TFT canvas (255 where lit)
+_TFT_LOCK_ICON = Image.frombytes("L", (_LOCK_ICON_W, _LOCK_ICON_H), bytes(255 * v for v in _LOCK_ICON_MASK))
+
+
+@lru_cache(maxsize=4)
+def _outline_mask(w, h):
+    """One byte per pixel for a w x h bitmap: 1 on the 1px border, 0 inside."""
+    return bytes(
+        x in (0, w - 1) or y in (0, h - 1) for y in range(h) for x in range(w)
+    )
+
+
+def _blit_mask(bitmap, mask, w, h):
+    """Copy a one-byte-per-pixel mask into a freshly created (all zero) displayio Bitmap."""
+    if bitmaptools is not None:
+        bitmaptools.arrayblit(bitmap, mask, 0, 0, w, h)
+        return
+    for i, value in enumerate(mask):
+        if value:
+            bitmap[i % w, i // w] = value
+
+
+# Floor for the size of one SPI write of TFT pixel data: an even byte count (whole RGB565
+# pixels) below spidev's default bufsiz of 4096. init_st7789() raises it to the module's
+# actual bufsiz when that can be read (see _spidev_bufsiz)
+_SPI_CHUNK = 4032
+
+# Persisted _scan_available_fonts() result, reused while the search dirs' mtimes match
+_FONT_INDEX_CACHE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "scannerproject", "font_index.json"
+)
+
+# spidev's per-transfer buffer limit (module parameter, 4096 unless set on the kernel cmdline)
+_SPIDEV_BUFSIZ_PATH = "/sys/module/spidev/parameters/bufsiz"
+
+
+def _spidev_bufsiz() -> Optional[int]:
+    """spidev's bufsiz in bytes, or None off Linux / when the module is not loaded."""
+    try:
+        with open(_SPIDEV_BUFSIZ_PATH) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=4)
+def _tft_header_chrome(width, height, outline_box):
+    """Static TFT header band: black fill plus the signal-meter outline, built once per geometry."""
+    band = Image.new("L", (width, height), 0)
+    ImageDraw.Draw(band).rectangle(outline_box, outline=255)
+    return band
+
+
+@lru_cache(maxsize=64)
+def _progress_bar_image(w, h, inner_w):
+    """1-bit w x h outlined bar filled inner_w pixels from the left; one per fill level."""
+    bar = Image.new("1", (w, h))
+    draw = ImageDraw.Draw(bar)
+    draw.rectangle((0, 0, w - 1, h - 1), outline=1)
+    if inner_w > 0 and h > 2:
+        draw.rectangle((1, 1, inner_w, h - 2), fill=1)
+    return bar
+
+
+@lru_cache(maxsize=32)
+def _scroll_windows(text, max_width):
+    """Every window of a back-and-forth scroll over text, in display order.
+
+    The text is padded with 3 spaces; the first and last windows appear twice so
+    the scroll pauses at each end for readability.
+    """
+    padded = text + "   "
+    max_offset = max(0, len(padded) - max_width)
+    offsets = [0, 0] + list(range(1, max_offset)) + [max_offset, max_offset] + list(range(max_offset - 1, 0, -1))
+    return tuple(padded[o:o + max_width] for o in offsets)
+
+
+@lru_cache(maxsize=1)
+def _oled_glyphs():
+    """Load font5x8.bin as (glyph_masks, glyph_width), or None if unavailable.
+
+    The file stores one byte per glyph column with the top pixel in bit 0, so the
+    whole table unpacks as a transposed LSB-first 1-bit strip in a single call.
+    """
+    for path in _OLED_FONT_PATHS:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+        width, height = data[0], data[1]
+        count = (len(data) - 2) // width
+        if height != 8 or count <= 0:
+            continue
+        strip = Image.frombytes(
+            "1", (8, count * width), data[2:2 + count * width], "raw", "1;R"
+        ).transpose(_TRANSPOSE)
+        return [strip.crop((i * width, 0, (i + 1) * width, 8)) for i in range(count)], width
+    return None
+
+
+@lru_cache(maxsize=128)
+def _oled_line_mask(line):
+    """1-bit mask of a whole text line in font5x8 glyphs (glyph width + 1px advance)."""
+    masks, width = _oled_glyphs()
+    line_mask = Image.new("1", (max(1, len(line) * (width + 1)), 8))
+    for i, ch in enumerate(line):
+        code = ord(ch)
+        if code < len(masks):
+            line_mask.paste(masks[code], (i * (width + 1), 0))
+    return line_mask
+
+
+class _ExtraView(NamedTuple):
+    """The fields of OP25Client's ``extra`` dict that the displays read, coerced once per
+    frame by _extra_view() so the draw paths use them without get()/bool()/float() calls.
+    """
+    active: bool            # a transmission is in progress
+    srcaddr: Optional[int]  # radio ID of the current transmission (None when unknown)
+    encrypted: bool
+    last_activity: object   # seconds since the last transmission, shown as-is
+    meter: int              # signal meter fill in pixels (_meter_fill of signal_quality)
+    locked: bool            # signal_locked
+    nac: object             # site identifiers, '--' when missing
+    wacn: object
+    sysid: object
+    error: object           # OP25 error text, or None
+
+
+def _extra_view(extra) -> _ExtraView:
+    """Coerce an OP25 ``extra`` dict (None allowed) into an _ExtraView."""
+    get = (extra or {}).get
+    return _ExtraView(
+        active=bool(get('active')),
+        srcaddr=get('srcaddr'),
+        encrypted=bool(get('encrypted')),
+        last_activity=get('last_activity'),
+        meter=_meter_fill(get('signal_quality')),
+        locked=bool(get('signal_locked')),
+        nac=get('nac', '--'),
+        wacn=get('wacn', '--'),
+        sysid=get('sysid', '--'),
+        error=get('error'),
+    )
+
+
+class _SettingsView(NamedTuple):
+    """The settings the per-frame paths read, looked up once per frame by _settings_view()
+    with the same defaults the draw paths used to pass to settings.get().
+    """
+    volume_level: object = 0
+    mute: object = None
+    recording: object = None
+    tft_enable: object = True
+    dump_frame: bool = False             # dump_frame, or the older save_debug_image
+    tft_update_interval: object = None   # None: the display's own minimum interval
+    oled_refresh_rate: object = 20
+    oled_scroll_speed: object = 0.2
+    volume_poll_interval: object = 0.2
+    volume_hint_grace: object = 0.6
+
+
+_DEFAULT_SETTINGS_VIEW = _SettingsView()
+
+
+def _settings_view(settings) -> _SettingsView:
+    """Read a settings dict (None allowed) into a _SettingsView."""
+    if not settings:
+        return _DEFAULT_SETTINGS_VIEW
+    get = settings.get
+    return _SettingsView(
+        volume_level=get('volume_level', 0),
+        mute=get('mute'),
+        recording=get('recording'),
+        tft_enable=get('tft_enable', True),
+        dump_frame=bool(get('dump_frame', get('save_debug_image', False))),
+        tft_update_interval=get('tft_update_interval'),
+        oled_refresh_rate=get('oled_refresh_rate', 20),
+        oled_scroll_speed=get('oled_scroll_speed', 0.2),
+        volume_poll_interval=get('volume_poll_interval', 0.2),
+        volume_hint_grace=get('volume_hint_grace', 0.6),
+    )
+
+
+class _FrameSnapshot(NamedTuple):
+    """Per-frame environment shared by both displays (see DisplayManager._snapshot).
+    Immutable, so the TFT and OLED workers can read the same instance concurrently.
+    """
+    now: float
+    clock: str
+    volume: int
+    tg_info: Optional[dict]
+    ev: _ExtraView
+    sv: _SettingsView
+    pace: float = 0.0
+    # DisplayManager._frame_version when update() took the snapshot; None for direct calls
+    version: Optional[int] = None
+
+
+class _FrameWorker:
+    """Daemon thread that renders the newest submitted frame with ``render(*frame)``.
+
+    The queue holds one pending frame, so submitting replaces a frame the worker has not
+    picked up yet and bursts of updates coalesce into the latest state. A frame may name
+    its own render callable (e.g. the OLED menu instead of the status screen). ``lock`` is held
+    while a frame renders; callers drawing to the same display take it too and call
+    discard() so a stale frame cannot land on top of what they drew.
+    """
+
+    def __init__(self, name, render):
+        self.name = name
+        self.queue = queue.Queue(maxsize=1)
+        self.lock = threading.RLock()
+        self._render = render
+        self._thread = None
+        # Makes drop-then-put atomic when more than one thread submits
+        self._submit_lock = threading.Lock()
+        # Bumped by discard(); frames submitted before the bump are dropped unrendered
+        self._generation = 0
+        # Set by stop(); later submits are ignored instead of starting a new thread
+        self._stopped = False
+
+    def submit(self, frame, render=None):
+        """Queue a frame, replacing any frame the worker has not picked up yet.
+        render overrides the worker's default render callable for this frame.
+        """
+        with self._submit_lock:
+            if self._stopped:
+                return
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._drop_pending()
+            # Producers are serialized here, so there is room after the drop above
+            self.queue.put_nowait((self._generation, render or self._render, frame))
+
+    def discard(self):
+        """Drop pending frames and any frame picked up but not yet rendered."""
+        with self.lock:
+            self._generation += 1
+            self._drop_pending()
+
+    def join(self):
+        """Block until every submitted frame has been rendered or dropped."""
+        self.queue.join()
+
+    def stop(self, timeout=2.0):
+        """Discard any pending frame and wait for the worker thread to exit.
+        The worker is not restarted afterwards: later submit() calls do nothing.
+        """
+        with self._submit_lock:
+            self._stopped = True
+            thread = self._thread
+            if thread is None:
+                return
+            # No submit can refill the slot while the lock is held, so the put cannot block
+            self._drop_pending()
+            self.queue.put_nowait(None)
+        thread.join(timeout)
+        if thread.is_alive():
+            logging.warning(f"{self.name} did not stop within timeout")
+        self._thread = None
+
+    def _drop_pending(self):
+        try:
+            self.queue.get_nowait()
+            self.queue.task_done()
+        except queue.Empty:
+            pass
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                generation, render, frame = item
+                with self.lock:
+                    if generation == self._generation:
+                        render(*frame)
+            except Exception as e:
+                logging.error(f"{self.name} failed to render frame: {e}")
+            finally:
+                # Lets join() wait for the frame currently on screen to land
+                self.queue.task_done()
+
+
 class DisplayManager:
-    def __init__(self, talkgroup_manager=None, rotation=0):
+    # Resolved once at import so each _load_font() call skips the stat() walk
+    _FONT_PATH = next((p for p in _DEFAULT_FONT_PATHS if os.path.exists(p)), None)
+
+    def __init__(self, talkgroup_manager=None, rotation=0, oled_i2c_hz=_OLED_I2C_HZ):
         # ST7789 TFT settings
         self._panel_native_width = 240  # native portrait width
         self._panel_native_height = 320  # native portrait height
-        self.image_path = "/tmp/scanner_screen.jpg"
+        # Debug frame dump; BMP is a plain copy of the pixels, no JPEG encode per frame
+        self.image_path = "/tmp/scanner_screen.bmp"
         self.talkgroup_manager = talkgroup_manager
         self._last_tft_signature = None
+        # Persistent TFT canvas for the RGB/framebuffer paths (see _render_rgb_layout_like_displayio)
+        self._tft_img = None
+        self._tft_draw = None
+        self._tft_band_sigs = {}
+        # Canvas boxes [(x0, y0, x1, y1), ...] (end-exclusive, sorted by y0, rows disjoint)
+        # changed since the last successful push, or None
+        self._tft_dirty = None
+        # Full-screen RGB scratch frame reused by show_message()/clear(), blanked in place
+        self._tft_scratch = None
+        # Reused big-endian RGB565 output for "L" canvas pushes (NumPy only; see _panel_pixels)
+        self._tft_pixels = None
+        # Formatted TFT strings keyed by (kind, *inputs), e.g. the NAC/WACN/SYS line
+        self._text_cache = {}
         self.rotation = (
             rotation if rotation in [0, 90, 180, 270] else 180
         )  # Rotation angle
@@ -83,6 +717,8 @@ class DisplayManager:
             self._font_pixel_small = self.font_small
         # Font registry/cache to allow explicit font selection by name
         self._font_cache = {}
+        # Names _resolve_font_path() found in no search dir
+        self._missing_fonts = set()
         self._font_search_dirs = [
             "/usr/share/fonts/truetype/dejavu",
             "/usr/share/fonts/truetype/liberation",
@@ -94,10 +730,11 @@ class DisplayManager:
         except Exception:
             self._font_index = {}
             self._font_available_names = []
+        self._resolve_tft_fonts()
 
         # Initialize scrolling state for OLED
-        self.scroll_offset = 0
-        self.scroll_direction = 1
+        self.scroll_offset = 0  # index into _scroll_windows(self._scroll_text, ...)
+        self._scroll_text = None
         self.last_scroll_time = 0
         self.scroll_delay = 0.5  # Seconds between scroll updates (will be overridden by settings)
         self.current_scroll_text = ""
@@ -107,19 +744,84 @@ class DisplayManager:
         self._oled_min_interval = 0.05  # default 20 Hz (1/20 = 0.05)
         self._oled_error_count = 0
         self._oled_disabled_until = 0.0
-        # Volume cache (reduce shell calls)
+        # Held while the bus is being reopened; other callers skip instead of queueing a retry
+        self._oled_reinit_lock = threading.Lock()
+        # Skip OLED redraws while the visible inputs are unchanged (see _frame_identity)
+        self._last_oled_key = None
+        self._last_oled_draw = 0.0
+        self._oled_scrolling = False
+        # Gaps between frame-key changes seen by update(), used to pace idle refreshes
+        self._change_intervals = deque(maxlen=_PACE_HISTORY)
+        self._last_change_key = None
+        self._last_change_time = None
+        # Bumped by update() whenever the frame key changes; displays compare this one int
+        # instead of re-building and diffing the key tuple
+        self._frame_version = 0
+        # Reusable 1-bit canvas; frames are composed here and copied to the OLED in one pass
+        self._oled_img = None
+        self._oled_draw = None
+        # Text of each menu row currently on the canvas (None = canvas holds something else)
+        self._oled_rows = None
+        # Last drawn OLED header strip and the inputs it was drawn from
+        self._oled_hdr_sig = None
+        self._oled_hdr_img = None
+        # Copy of the last buffer sent to the panel (None = resend everything) and a
+        # scratch buffer for 0x40-prefixed page runs
+        self._oled_shadow = None
+        self._oled_tx = bytearray(_OLED_WIDTH * _OLED_PAGES + 1)
+        # ((tgid, talkgroup table version), info) of the last talkgroup lookup
+        self._tg_lookup = (None, None)
+        # (driver, buf page view, i2c_device, buffer) probed by _oled_driver_paths()
+        self._oled_paths = None
+        # Canvas bytes of the last frame that reached the panel (None = unknown, push next frame)
+        self._oled_last_frame = None
+        # Volume cache (reduce shell calls); timestamps are time.monotonic() so clock steps
+        # (NTP sync on a Pi without RTC) cannot freeze or expire it. -inf = never polled.
         self._vol_cache = 0
-        self._vol_last_time = 0.0
+        self._vol_last_time = float("-inf")
         self._vol_poll_interval = 1.0  # seconds between actual system volume polls
         self._vol_hint_grace = 0.6     # seconds to trust UI hint before polling system
-        self._last_user_volume_change_time = 0.0
+        self._last_user_volume_change_time = float("-inf")
+        # libpulse connection (pulsectl), opened on first poll; retry time after a failure
+        self._pulse = None
+        self._pulse_retry_at = 0.0
+        # Index of the default sink, resolved once and cleared when the server default changes
+        self._pulse_sink_index = None
+        # ALSA 'Master' mixer (pyalsaaudio), opened on first use; retry time after a failure
+        self._alsa_mixer = None
+        self._alsa_retry_at = 0.0
+        # _VOLUME_CMDS still worth forking; a tool that is not installed is dropped
+        self._vol_cmds = list(_VOLUME_CMDS)
+        # Second libpulse connection on a daemon thread that expires the volume cache on sink events
+        self._pulse_events = None
+        self._pulse_event_thread = None
         # ST7789 TFT throttling/settings
         self._last_tft_push = 0.0
+        # rgb driver: write address windows straight to its SPI device (settings 'tft_direct_spi')
+        self._tft_direct_spi = True
+        # Bytes per SPI write in _spi_block(); raised to spidev's bufsiz when that is larger
+        self._spi_chunk = _SPI_CHUNK
         self._tft_min_interval = (
             0.2  # default seconds between ST7789 updates (reduce flicker)
         )
         # Skip TFT during rapid user interactions
         self._skip_tft_until = 0.0
+        # Each display renders/pushes on its own worker thread (started on first update()) so
+        # SPI and I2C transfers overlap each other and the caller's next scan; OLED menu frames
+        # go through the OLED worker too. The worker locks serialize display state with
+        # show_message/clear/cleanup.
+        self._tft_frames = _FrameWorker("tft-worker", self.update_tft)
+        self._tft_lock = self._tft_frames.lock
+        self._oled_frames = _FrameWorker("oled-worker", self.update_oled)
+        self._oled_lock = self._oled_frames.lock
+        # Frame identity of the last pushed TFT frame (see _frame_identity)
+        self._last_tft_key = None
+        # (epoch second, "HH:MM:SS") of the last formatted clock
+        self._clock_cache = (None, "")
+        # Only dump frames to image_path when explicitly enabled (settings 'dump_frame',
+        # or the older 'save_debug_image' key)
+        self._save_debug_image = False
+        self._last_debug_dump = 0.0
         # Volume adjustment mode (UI hint)
         self._volume_mode_active = False
 
@@ -129,15 +831,34 @@ class DisplayManager:
         # RGB driver (Pi) display
         self.rgb_display_available = False
         self.rgb_display = None
+        # Kernel framebuffer (fbtft) TFT, opened once and kept mmapped
+        self._fb_path = "/dev/fb1"
+        self._fb_fd = None
+        self._fb_map = None
+        self._fb_bpp = 16
+        self._fb_stride = 0
+        # NumPy view of the mapping as (rows, stride in pixels), when NumPy is available
+        self._fb_pixels = None
+        # Set once init_st7789 falls back to the framebuffer; enables reopen with backoff
+        self._fb_wanted = False
+        self._fb_retry_at = 0.0
+        self._fb_retry_delay = 1.0
         # ST7789 initialization will be done later via init_st7789() when settings are available
 
         # Pre-create display elements for better performance
         self._st7789_splash = None
         self._st7789_text_labels = {}
+        # Text last assigned to each label (see _set_label)
+        self._st7789_label_text = {}
+        # Inputs of the last frame applied to the labels (see _update_st7789_display)
+        self._st7789_frame_sig = None
+        # Whether the lock TileGrid currently sits beside the meter (False = parked off-screen)
+        self._st7789_lock_shown = False
         self._st7789_bars = {}
 
         # Color scheme
-        self.colors = {
+        # Resolved to (r, g, b) once so draw calls never go through Pillow's color-name parser
+        self.colors = {name: ImageColor.getrgb(color) for name, color in {
             'background': 'black',
             'text': 'white',
             'header': 'orange',
@@ -146,26 +867,17 @@ class DisplayManager:
             'high_priority': 'red',
             'medium_priority': 'orange',
             'low_priority': 'green'
-        }
+        }.items()}
 
         # Initialize OLED display (simple approach like working code)
+        # Requested I2C clock; stepped down to _OLED_I2C_SAFE_HZ if the panel errors at it
+        self._oled_i2c_hz = int(oled_i2c_hz)
+        # Frames pushed since the bus was opened (errors within the first few trigger the step down)
+        self._oled_pushes = 0
         try:
-            # Allow higher I2C frequency for faster OLED refresh (default 400kHz)
-            i2c_frequency_hz = 400_000
-            try:
-                # If SettingsManager is used to pass settings, we may not have it here; keep default
-                # Caller can later adjust via a setter if needed
-                pass
-            except Exception:
-                pass
-            try:
-                i2c = busio.I2C(board.SCL, board.SDA, frequency=i2c_frequency_hz)
-            except TypeError:
-                # Older libraries may not support frequency kwarg
-                i2c = busio.I2C(board.SCL, board.SDA)
-            self.oled = adafruit_ssd1306.SSD1306_I2C(128, 64, i2c)
-            self.oled.fill(0)
-            self.oled.show()
+            if not _import_hardware():
+                raise RuntimeError("board/busio/adafruit_ssd1306 not installed")
+            self.oled = self._open_oled()
             self.oled_available = True
             logging.info("OLED display initialized successfully")
         except Exception as e:
@@ -179,23 +891,71 @@ class DisplayManager:
         if not hasattr(self, "oled"):
             self.oled = None
 
+    def _open_oled(self):
+        """Create the SSD1306 on a new I2C bus at self._oled_i2c_hz and clear it.
+        If the panel does not answer at a raised clock, retry once at _OLED_I2C_SAFE_HZ
+        and keep that. (On Raspberry Pi Linux the kernel sets the bus clock and the
+        frequency argument is ignored; see README.)
+        """
+        # Pin objects are resolved once per process (see _resolve_pin), not on every reopen
+        scl, sda = _resolve_pin("SCL"), _resolve_pin("SDA")
+        while True:
+            try:
+                try:
+                    i2c = busio.I2C(scl, sda, frequency=self._oled_i2c_hz)
+                except TypeError:
+                    # Older libraries may not support frequency kwarg
+                    i2c = busio.I2C(scl, sda)
+                oled = adafruit_ssd1306.SSD1306_I2C(128, 64, i2c)
+                oled.fill(0)
+                oled.show()
+                self._oled_pushes = 0
+                return oled
+            except OSError as e:
+                if self._oled_i2c_hz <= _OLED_I2C_SAFE_HZ:
+                    raise
+                logging.warning(
+                    f"OLED not responding at {self._oled_i2c_hz} Hz I2C ({e}); retrying at {_OLED_I2C_SAFE_HZ} Hz"
+                )
+                self._oled_i2c_hz = _OLED_I2C_SAFE_HZ
+
     def _reinit_oled(self) -> bool:
-        """Attempt to re-initialize the OLED after an I/O error with backoff."""
+        """Attempt to re-initialize the OLED after an I/O error with backoff.
+        Only one caller retries at a time; a concurrent one returns False at once.
+        """
+        if not self._oled_reinit_lock.acquire(blocking=False):
+            return False
+        try:
+            return self._try_reinit_oled()
+        finally:
+            self._oled_reinit_lock.release()
+
+    def _try_reinit_oled(self) -> bool:
+        """Body of _reinit_oled(); runs with _oled_reinit_lock held."""
         try:
             # Avoid hammering the bus if we're in backoff
             now = time.time()
             if now < getattr(self, "_oled_disabled_until", 0.0):
                 return False
 
+            # A panel that fails within its first frames at a raised clock is not retried at it
+            if (
+                self.oled_available
+                and self._oled_pushes < _OLED_I2C_PROBE_FRAMES
+                and self._oled_i2c_hz > _OLED_I2C_SAFE_HZ
+            ):
+                logging.warning(
+                    f"OLED errored at {self._oled_i2c_hz} Hz I2C; falling back to {_OLED_I2C_SAFE_HZ} Hz"
+                )
+                self._oled_i2c_hz = _OLED_I2C_SAFE_HZ
+
             # Try to recreate I2C and the display object
-            try:
-                i2c = busio.I2C(board.SCL, board.SDA, frequency=400_000)
-            except TypeError:
-                i2c = busio.I2C(board.SCL, board.SDA)
-            oled = adafruit_ssd1306.SSD1306_I2C(128, 64, i2c)
-            oled.fill(0)
-            oled.show()
-            self.oled = oled
+            if not _import_hardware():
+                raise RuntimeError("board/busio/adafruit_ssd1306 not installed")
+            self.oled = self._open_oled()
+            self._oled_shadow = None
+            self._oled_last_frame = None
+            self._oled_rows = None
             self.oled_available = True
             # Reset error/backoff
             self._oled_error_count = 0
@@ -209,6 +969,8 @@ class DisplayManager:
                 backoff = min(60.0, float(2 ** min(self._oled_error_count, 6)))
             except Exception:
                 backoff = 5.0
+            # +/-20% jitter so retries do not stay in step with other periodic bus traffic
+            backoff *= random.uniform(0.8, 1.2)
             self._oled_disabled_until = time.time() + backoff
             self.oled_available = False
             self.oled = None
@@ -222,6 +984,8 @@ class DisplayManager:
         preferred_driver = (
             str(settings.get("tft_driver", "displayio")).lower() if settings else "displayio"
         )
+        # Pin lookups below need Blinka's board module
+        _import_hardware()
 
         # Try RGB driver first if requested
         if preferred_driver == "rgb" and RGB_ST7789_AVAILABLE:
@@ -234,9 +998,9 @@ class DisplayManager:
                 cs_pin_name = settings.get("st7789_cs_pin", "D5")
                 dc_pin_name = settings.get("st7789_dc_pin", "D25")
                 rst_pin_name = settings.get("st7789_rst_pin", "D27")
-                tft_cs = digitalio.DigitalInOut(getattr(board, cs_pin_name, board.D5))
-                tft_dc = digitalio.DigitalInOut(getattr(board, dc_pin_name, board.D25))
-                tft_rst = digitalio.DigitalInOut(getattr(board, rst_pin_name, board.D27))
+                tft_cs = digitalio.DigitalInOut(_resolve_pin(cs_pin_name))
+                tft_dc = digitalio.DigitalInOut(_resolve_pin(dc_pin_name))
+                tft_rst = digitalio.DigitalInOut(_resolve_pin(rst_pin_name))
                 baudrate = int(settings.get("st7789_baudrate", 48_000_000))
                 rotation = int(settings.get("tft_rotation", 180))
                 if rotation in (0, 180):
@@ -260,6 +1024,17 @@ class DisplayManager:
                 )
                 self.rgb_display_available = True
                 self.st7789_available = True
+                self._tft_direct_spi = bool(settings.get("tft_direct_spi", True))
+                bufsiz = _spidev_bufsiz()
+                if bufsiz is not None:
+                    # Whole pixels per write; a full frame goes out in one transfer if it fits
+                    self._spi_chunk = max(_SPI_CHUNK, bufsiz & ~1)
+                    frame_bytes = self.width * self.height * 2
+                    if bufsiz < frame_bytes:
+                        logging.info(
+                            f"spidev bufsiz is {bufsiz} bytes; add spidev.bufsiz={frame_bytes} to "
+                            f"/boot/cmdline.txt to send full TFT frames in one SPI transfer"
+                        )
                 logging.info(
                     f"RGB ST7789 initialized ({self.width}x{self.height}) CS:{cs_pin_name} DC:{dc_pin_name} RST:{rst_pin_name} baud:{baudrate} rot:{rotation}"
                 )
@@ -285,9 +1060,9 @@ class DisplayManager:
                 cs_pin_name = settings.get("st7789_cs_pin", "D5") if settings else "D5"
                 dc_pin_name = settings.get("st7789_dc_pin", "D25") if settings else "D25"
                 rst_pin_name = settings.get("st7789_rst_pin", "D27") if settings else "D27"
-                tft_cs = getattr(board, cs_pin_name, board.D5)
-                tft_dc = getattr(board, dc_pin_name, board.D25)
-                tft_rst = getattr(board, rst_pin_name, board.D27)
+                tft_cs = _resolve_pin(cs_pin_name)
+                tft_dc = _resolve_pin(dc_pin_name)
+                tft_rst = _resolve_pin(rst_pin_name)
                 display_bus = FourWire(
                     spi, command=tft_dc, chip_select=tft_cs, reset=tft_rst
                 )
@@ -318,53 +1093,270 @@ class DisplayManager:
         else:
             logging.warning("No suitable ST7789 driver available")
 
+        # Last resort: a TFT exposed as a kernel framebuffer device
+        if not self.st7789_available:
+            self._fb_wanted = True
+            self._open_framebuffer()
+
+    @property
+    def _framebuffer_available(self) -> bool:
+        """True while the framebuffer is mapped; derived from the mapping so it cannot go stale."""
+        return self._fb_map is not None
+
+    def _open_framebuffer(self) -> bool:
+        """Open and mmap the TFT framebuffer device once for direct pixel writes.
+        Geometry, depth and stride come from the kernel; the layout adopts the device resolution.
+        """
+        if self._fb_map is not None:
+            return True
+        if not os.path.exists(self._fb_path):
+            return False
+        try:
+            self._fb_fd = os.open(self._fb_path, os.O_RDWR)
+            geometry = _framebuffer_geometry(self._fb_fd)
+            if geometry is not None:
+                xres, yres, bpp, stride = geometry
+                if bpp not in (16, 32):
+                    raise ValueError(f"unsupported depth {bpp} bpp")
+                if (xres, yres) != (self.width, self.height):
+                    logging.info(
+                        f"Framebuffer is {xres}x{yres}, adjusting layout from {self.width}x{self.height}"
+                    )
+                    self.width, self.height = xres, yres
+            else:
+                # Not a real fbdev (ioctl unsupported): assume packed RGB565 at our size
+                bpp, stride = 16, self.width * 2
+            self._fb_bpp = bpp
+            self._fb_stride = stride
+            self._fb_map = mmap.mmap(
+                self._fb_fd, stride * self.height, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE
+            )
+            pixel_bytes = bpp // 8
+            if np is not None and stride % pixel_bytes == 0:
+                self._fb_pixels = np.frombuffer(
+                    self._fb_map, dtype="<u2" if bpp == 16 else "<u4"
+                ).reshape(self.height, stride // pixel_bytes)
+            logging.info(
+                f"Framebuffer {self._fb_path} mapped ({self.width}x{self.height}, {bpp} bpp, stride {stride})"
+            )
+            return True
+        except PermissionError as e:
+            # Writes go straight to the device (no sudo/fbi), so the user needs group access
+            logging.warning(
+                f"Framebuffer {self._fb_path} not writable ({e}); "
+                "add the scanner user to the 'video' group (see README)"
+            )
+            self._close_framebuffer()
+            return False
+        except Exception as e:
+            logging.warning(f"Framebuffer {self._fb_path} not usable: {e}")
+            self._close_framebuffer()
+            return False
+
+    def _close_framebuffer(self):
+        """Release the framebuffer mapping and file descriptor."""
+        # The NumPy view exports the mapping's buffer; drop it or close() raises BufferError
+        self._fb_pixels = None
+        try:
+            if self._fb_map is not None:
+                self._fb_map.close()
+        except Exception:
+            pass
+        try:
+            if self._fb_fd is not None:
+                os.close(self._fb_fd)
+        except Exception:
+            pass
+        self._fb_map = None
+        self._fb_fd = None
+
+    def _reopen_framebuffer(self) -> bool:
+        """Retry mapping the framebuffer with backoff (fbtft may load after we start)."""
+        if not self._fb_wanted or self._fb_map is not None:
+            return self._fb_map is not None
+        now = time.time()
+        if now < self._fb_retry_at:
+            return False
+        if self._open_framebuffer():
+            self._fb_retry_delay = 1.0
+            return True
+        self._fb_retry_at = now + self._fb_retry_delay
+        self._fb_retry_delay = min(60.0, self._fb_retry_delay * 2)
+        return False
+
+    def _blit_framebuffer(self, img, y0=0, y1=None) -> bool:
+        """Write rows [y0, y1) of a full-screen PIL image straight into the mmapped framebuffer."""
+        if self._fb_map is None or img is None:
+            return False
+        if y1 is None:
+            y1 = self.height
+        if (y0, y1) != (0, self.height):
+            img = img.crop((0, y0, self.width, y1))
+        try:
+            pixels = self._fb_pixels
+            if pixels is not None:
+                # Convert and store the rows straight into device memory (handles padded strides)
+                pixels[y0:y1, :self.width] = _fb_pixel_values(img, self._fb_bpp)
+                return True
+            if self._fb_bpp == 16:
+                data = _rgb565_bytes(img)
+            else:
+                # 32 bpp fbdev is XRGB8888, i.e. B, G, R, X bytes in memory
+                data = img.convert("RGB").tobytes("raw", "BGRX")
+            row = self.width * self._fb_bpp // 8
+            stride = self._fb_stride
+            if stride == row:
+                self._fb_map.seek(y0 * stride)
+                self._fb_map.write(data)
+            else:
+                # Padded scanlines: copy row by row
+                fb_map = self._fb_map
+                for i, y in enumerate(range(y0, y1)):
+                    fb_map[y * stride:y * stride + row] = data[i * row:(i + 1) * row]
+            return True
+        except (OSError, ValueError) as e:
+            # Device went away or the mapping is no longer valid: drop it and let
+            # _reopen_framebuffer() map it again instead of failing every frame
+            logging.warning(f"Framebuffer write failed, will reopen: {e}")
+            pixels = None  # release the view so the mapping can actually close
+            self._close_framebuffer()
+            return False
+        except Exception as e:
+            logging.debug(f"Framebuffer write failed: {e}")
+            return False
+
     # Legacy _init_fast_display removed (unused)
 
     # Legacy _format_signal_bars removed (unused)
 
-    def _get_system_volume_percent(self, fallback: int = 0) -> int:
+    def _get_system_volume_percent(self, fallback: int = 0, ttl=None) -> int:
         """Return current system output volume percent using PulseAudio or ALSA.
-        Caches for ~1s to avoid frequent shell calls.
+        Cached for ttl seconds (default: the configured poll interval) to avoid frequent
+        shell calls; PulseAudio sink events expire the cache early when pulsectl is present.
         """
-        now = time.time()
+        now = time.monotonic()
         # During recent user volume interaction, trust UI hint to avoid flicker/mismatch
         if now - getattr(self, "_last_user_volume_change_time", 0.0) < float(getattr(self, "_vol_hint_grace", 0.6)):
             return self._vol_cache
         # Honor configured poll interval to make on-screen volume feel more responsive
-        if now - self._vol_last_time < float(getattr(self, "_vol_poll_interval", 1.0)):
+        if ttl is None:
+            ttl = float(getattr(self, "_vol_poll_interval", 1.0))
+        if now - self._vol_last_time < ttl:
             return self._vol_cache
-        vol = fallback
-        # Try PulseAudio (pactl)
-        try:
-            out = subprocess.check_output(
-                ["pactl", "get-sink-volume", "@DEFAULT_SINK@"],
-                stderr=subprocess.DEVNULL,
-                text=True,
-                timeout=0.4,
-            )
-            m = re.search(r"(\d{1,3})%", out)
-            if m:
-                vol = int(m.group(1))
-        except Exception:
-            # Try ALSA (amixer)
-            try:
-                out = subprocess.check_output(
-                    ["amixer", "get", "Master"],
-                    stderr=subprocess.DEVNULL,
-                    text=True,
-                    timeout=0.4,
-                )
-                m = re.search(r"\[(\d{1,3})%\]", out)
-                if m:
-                    vol = int(m.group(1))
-            except Exception:
-                pass
+        # PulseAudio first (default sink: libpulse, then pactl); ALSA Master only without it
+        vol = self._pulse_volume_percent()
+        if vol is None:
+            vol = self._shell_volume_percent("pactl")
+        if vol is None:
+            vol = self._alsa_volume_percent()
+        if vol is None:
+            vol = self._shell_volume_percent("amixer")
+        if vol is None:
+            vol = fallback
         vol = max(0, min(100, int(vol)))
         self._vol_cache = vol
         self._vol_last_time = now
         return vol
 
-    def _get_volume_percent(self, settings) -> int:
+    def _shell_volume_percent(self, tool):
+        """Volume percent from the _VOLUME_CMDS entry for tool (pactl/amixer), or None."""
+        for cmd in tuple(self._vol_cmds):
+            if cmd[0] != tool:
+                continue
+            try:
+                out = subprocess.check_output(cmd, stderr=subprocess.DEVNULL, timeout=0.4)
+            except FileNotFoundError:
+                # Not installed: stop forking it every poll
+                self._vol_cmds.remove(cmd)
+                return None
+            except Exception:
+                return None
+            return _first_percent(out)
+        return None
+
+    def _pulse_volume_percent(self):
+        """Default sink volume from a persistent libpulse connection, or None to use the shell tools."""
+        if pulsectl is None or time.monotonic() < self._pulse_retry_at:
+            return None
+        try:
+            if self._pulse is None:
+                self._pulse = pulsectl.Pulse("scanner-display", threading_lock=True)
+                self._start_pulse_events()
+            pulse = self._pulse
+            index = self._pulse_sink_index
+            if index is None:
+                index = pulse.get_sink_by_name(pulse.server_info().default_sink_name).index
+                self._pulse_sink_index = index
+            # One round trip per poll once the default sink is known
+            sink = pulse.sink_info(index)
+            return int(round(sink.volume.value_flat * 100))
+        except Exception as e:
+            # PulseAudio not running/restarted or sink removed: fall back, reconnect later
+            logging.debug(f"libpulse volume query failed: {e}")
+            self._close_pulse()
+            self._pulse_retry_at = time.monotonic() + 30.0
+            return None
+
+    def _alsa_volume_percent(self):
+        """'Master' volume from a persistent pyalsaaudio mixer, or None to use the shell tools."""
+        if alsaaudio is None or time.monotonic() < self._alsa_retry_at:
+            return None
+        try:
+            if self._alsa_mixer is None:
+                self._alsa_mixer = alsaaudio.Mixer("Master")
+            return int(self._alsa_mixer.getvolume()[0])
+        except Exception as e:
+            logging.debug(f"ALSA mixer volume query failed: {e}")
+            self._alsa_mixer = None
+            self._alsa_retry_at = time.monotonic() + 30.0
+            return None
+
+    def _start_pulse_events(self):
+        """Start the sink-event listener thread unless one is already running."""
+        if self._pulse_event_thread is not None and self._pulse_event_thread.is_alive():
+            return
+        self._pulse_event_thread = threading.Thread(
+            target=self._pulse_event_loop, name="pulse-events", daemon=True
+        )
+        self._pulse_event_thread.start()
+
+    def _pulse_event_loop(self):
+        """Expire the volume cache whenever PulseAudio reports a sink or default-sink change."""
+        try:
+            with pulsectl.Pulse("scanner-display-events") as pulse:
+                pulse.event_mask_set("sink", "server")
+                pulse.event_callback_set(self._on_pulse_event)
+                self._pulse_events = pulse
+                pulse.event_listen()
+        except Exception as e:
+            logging.debug(f"libpulse event listener stopped: {e}")
+        finally:
+            self._pulse_events = None
+
+    def _on_pulse_event(self, event):
+        """pulsectl callback (listener thread): force the next volume read to query the server."""
+        if event.facility == "server":
+            # Default sink may have changed: look it up again on the next poll
+            self._pulse_sink_index = None
+        self._vol_last_time = float("-inf")
+
+    def _close_pulse(self):
+        """Drop the libpulse connections, if any, and stop the event listener."""
+        try:
+            if self._pulse_events is not None:
+                # Thread-safe in pulsectl: makes event_listen() return on the listener thread
+                self._pulse_events.event_listen_stop()
+        except Exception:
+            pass
+        try:
+            if self._pulse is not None:
+                self._pulse.close()
+        except Exception:
+            pass
+        self._pulse = None
+        self._pulse_sink_index = None
+
+    def _get_volume_percent(self, settings, ttl=None) -> int:
         """Return current system volume percentage; fallback to settings volume_level.
         Uses recent UI hint for a short grace window to avoid flicker.
         """
@@ -374,7 +1366,7 @@ class DisplayManager:
                 fallback = int(settings.get('volume_level', 0))
         except Exception:
             fallback = 0
-        return self._get_system_volume_percent(fallback)
+        return self._get_system_volume_percent(fallback, ttl)
 
     def set_volume_hint(self, volume_percent: int):
         """Provide a recent volume value to avoid slow system queries.
@@ -383,7 +1375,7 @@ class DisplayManager:
         try:
             vol = max(0, min(100, int(volume_percent)))
             self._vol_cache = vol
-            self._vol_last_time = time.time()
+            self._vol_last_time = time.monotonic()
             self._last_user_volume_change_time = self._vol_last_time
         except Exception:
             pass
@@ -392,106 +1384,233 @@ class DisplayManager:
         """Allow next OLED update to proceed immediately (bypass throttle once)."""
         try:
             self._last_oled_update = 0.0
+            self._last_oled_key = None
         except Exception:
             pass
 
-    def _format_oled_header(self, extra, settings) -> str:
-        """Header text for OLED left side: just volume (e.g., 'V55')."""
-        vol_num = self._get_volume_percent(settings)
-        return f"V{vol_num}"
+    def _frame_key(self, system, freq, tgid, ev, sv):
+        """Cheap tuple of every input the OLED/TFT layouts show (ev, sv: the frame's
+        _ExtraView and _SettingsView).
 
-    def _draw_lock_icon(self, x: int, y: int):
-        """Draw a tiny 6x8 padlock icon at (x,y) on the OLED (mono)."""
-        try:
-            # Body
-            # outer rect 6x5 starting at y+3
-            if hasattr(self.oled, 'rect'):
-                self.oled.rect(x, y + 3, 6, 5, 1)
-                # keyhole
-                self.oled.pixel(x + 3, y + 5, 1)
+        Equal keys mean the next frame would look the same (apart from the
+        clock), so callers can skip building and pushing it. The talkgroup table's
+        version is included so an edit to the current talkgroup is redrawn.
+        """
+        return (system, round(freq or 0, 4), tgid) + ev + (
+            sv.volume_level, sv.mute, sv.recording,
+            self._vol_cache, self._volume_mode_active,
+            getattr(self.talkgroup_manager, "version", None),
+        )
+
+    def _oled_canvas(self):
+        """Return the ImageDraw for the shared OLED canvas, cleared to black."""
+        self._oled_rows = None
+        if self._oled_img is None:
+            self._oled_img = Image.new("1", (_OLED_WIDTH, _OLED_HEIGHT))
+            self._oled_draw = ImageDraw.Draw(self._oled_img)
+        else:
+            # Solid fills use paste(color, box): a C fill with no ImageDraw setup
+            self._oled_img.paste(0, (0, 0, _OLED_WIDTH, _OLED_HEIGHT))
+        return self._oled_draw
+
+    def _oled_text(self, text, x, y, color=1):
+        """Draw text on the OLED canvas with the same 5x8 glyphs as framebuf.text()."""
+        glyphs = _oled_glyphs()
+        if glyphs is None:
+            self._oled_draw.text((x, y), text, font=self._font_pixel_small, fill=color)
+            return
+        width = glyphs[1]
+        # Characters that start left of the right edge; the rest are never visible
+        visible = max(0, (_OLED_WIDTH - x + width) // (width + 1))
+        img = self._oled_img
+        for line in text.split("\n"):
+            # One paste per line from a cached line mask instead of one per glyph
+            img.paste(color, (x, y), _oled_line_mask(line[:visible]))
+            y += 8
+
+    def _oled_row(self, y, text, height=10):
+        """Clear and redraw one text row of the OLED canvas, only if its text changed."""
+        if self._oled_rows.get(y) == text:
+            return False
+        self._oled_img.paste(0, (0, y, _OLED_WIDTH, y + height))
+        if text:
+            self._oled_text(text, 0, y, 1)
+        self._oled_rows[y] = text
+        return True
+
+    def _oled_push(self):
+        """Copy the canvas into the SSD1306 buffer and send it with a single show().
+        A canvas identical to the last pushed frame is skipped before any packing.
+        """
+        # Column-major packing of the canvas (one C transpose + encode): transposing makes
+        # each display column a row of 8 LSB-first bytes, one per page. It doubles as the
+        # frame's identity for the skip check, so the canvas is encoded only once.
+        frame = self._oled_img.transpose(_TRANSPOSE).tobytes("raw", "1;R")
+        if frame == self._oled_last_frame:
+            return
+        buf, pages = self._oled_driver_paths()[:2]
+        if buf is not None:
+            # Page-major MONO_VLSB: page p is every 8th byte of the packed columns from p
+            if pages is not None:
+                # One strided copy straight into the driver buffer (a (128, 8) -> (8, 128) transpose)
+                pages[:] = np.frombuffer(frame, dtype=np.uint8).reshape(_OLED_WIDTH, _OLED_PAGES).T
             else:
-                # fallback with pixels
-                for dx in range(6):
-                    self.oled.pixel(x + dx, y + 3, 1)
-                    self.oled.pixel(x + dx, y + 7, 1)
-                for dy in range(3, 8):
-                    self.oled.pixel(x, y + dy, 1)
-                    self.oled.pixel(x + 5, y + dy, 1)
-                self.oled.pixel(x + 3, y + 5, 1)
-            # Shackle (u-shape)
-            self.oled.pixel(x + 1, y + 2, 1)
-            self.oled.pixel(x + 4, y + 2, 1)
-            self.oled.pixel(x + 1, y + 1, 1)
-            self.oled.pixel(x + 4, y + 1, 1)
-            for dx in range(2, 4):
-                self.oled.pixel(x + dx, y + 0, 1)
-        except Exception:
-            # If drawing fails, ignore
-            pass
+                buf[:] = b"".join(frame[page::8] for page in range(_OLED_PAGES))
+        else:
+            self.oled.image(self._oled_img)
+        self._oled_show()
+        self._oled_pushes += 1
+        # Recorded only after a successful send, so a failed push is retried next frame
+        self._oled_last_frame = frame
+
+    def _oled_driver_paths(self):
+        """(buf, pages, i2c_device, buffer) for the current SSD1306 driver, probed once per
+        driver object rather than with getattr()s on every push.
+
+        buf: the 1024-byte MONO_VLSB framebuffer (None: push through image()); pages: a
+        (8, 128) NumPy view of it (None without NumPy); i2c_device/buffer: what _oled_show()
+        needs for page-run writes (device None: use the driver's show()).
+        """
+        oled = self.oled
+        paths = self._oled_paths
+        if paths is not None and paths[0] is oled:
+            return paths[1:]
+        buf = getattr(oled, "buf", None)
+        if buf is not None and len(buf) != _OLED_WIDTH * _OLED_HEIGHT // 8:
+            buf = None
+        pages = None
+        if buf is not None and np is not None:
+            pages = np.frombuffer(buf, dtype=np.uint8).reshape(_OLED_PAGES, _OLED_WIDTH)
+        device = getattr(oled, "i2c_device", None)
+        buffer = getattr(oled, "buffer", None)
+        if (
+            buffer is None
+            or getattr(oled, "page_addressing", False)
+            or len(buffer) != _OLED_WIDTH * _OLED_PAGES + 1
+        ):
+            device = None
+        self._oled_paths = (oled, buf, pages, device, buffer)
+        return self._oled_paths[1:]
+
+    def _oled_show(self):
+        """Send the pages of the SSD1306 buffer that changed since the last push.
+
+        adafruit_ssd1306's show() issues each of its six address commands as a separate
+        I2C transaction and always sends all 1024 bytes. Here each run of changed pages
+        goes out as one command burst plus one 0x40-prefixed data burst, under one bus
+        lock, and unchanged pages are skipped using a shadow of the last pushed buffer.
+        Falls back to show() on other drivers.
+        """
+        device, buffer = self._oled_driver_paths()[2:]
+        if device is None:
+            self.oled.show()
+            return
+        shadow = self._oled_shadow
+        tx = self._oled_tx
+        tx[0] = 0x40
+        with device:
+            page = 0
+            while page < _OLED_PAGES:
+                lo = 1 + page * _OLED_WIDTH
+                if shadow is not None and buffer[lo:lo + _OLED_WIDTH] == shadow[lo:lo + _OLED_WIDTH]:
+                    page += 1
+                    continue
+                first = page
+                page += 1
+                while page < _OLED_PAGES:
+                    lo = 1 + page * _OLED_WIDTH
+                    if shadow is not None and buffer[lo:lo + _OLED_WIDTH] == shadow[lo:lo + _OLED_WIDTH]:
+                        break
+                    page += 1
+                start, end = 1 + first * _OLED_WIDTH, 1 + page * _OLED_WIDTH
+                tx[1:1 + end - start] = buffer[start:end]
+                device.write(_ssd1306_window_cmds(first, page - 1))
+                device.write(tx, end=1 + end - start)
+        if shadow is None:
+            self._oled_shadow = bytearray(buffer)
+        else:
+            shadow[:] = buffer
 
-    def _draw_oled_header(self, extra, settings):
-        """Draw OLED header: time on far left, volume next, signal bar on far right."""
+    def _draw_lock_icon(self, x: int, y: int):
+        """Blit the prebuilt 6x8 padlock icon at (x,y) on the OLED canvas (mono)."""
+        self._oled_img.paste(1, (x, y), _OLED_LOCK_ICON)
+
+    def _clock_text(self, now=None):
+        """Local time of now (default: current) as HH:MM:SS, re-formatted at most once per second.
+        Both displays take their clock from this one string (the OLED header shows HH:MM).
+        """
+        sec = int(time.time() if now is None else now)
+        cached = self._clock_cache
+        if cached[0] == sec:
+            return cached[1]
+        # Plain integer formatting; strftime() goes through the C locale formatter
+        lt = time.localtime(sec)
+        text = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        self._clock_cache = (sec, text)
+        return text
+
+    def _draw_oled_header(self, ev, settings, volume=None, clock=None):
+        """Draw OLED header: time on far left, volume next, signal bar on far right.
+        The 10px strip is redrawn only when its inputs change; otherwise the last one is pasted.
+        """
         # Left-most: current time HH:MM
         try:
-            time_text = datetime.now().strftime("%H:%M")
+            time_text = (clock or self._clock_text())[:5]
         except Exception:
             time_text = "--:--"
+        # Volume text immediately to the right of time (e.g., 'V55')
+        vol_num = self._get_volume_percent(settings) if volume is None else volume
+        vol_text = f"V{vol_num}"
+
+        # Right: Signal rectangle fill (progress bar)
+        bar_w = _METER_INNER_W + 2  # total width of bar
+        bar_h = 8   # height of bar
+        inner_w = ev.meter
+        locked = ev.locked
+
+        sig = (time_text, vol_text, self._volume_mode_active, inner_w, locked)
+        if sig == self._oled_hdr_sig and self._oled_hdr_img is not None:
+            self._oled_img.paste(self._oled_hdr_img, (0, 0))
+            return
+
         # Draw time normally (not inverted)
         try:
-            self.oled.text(time_text[:5], 0, 0, 1)
+            self._oled_text(time_text, 0, 0, 1)
         except Exception:
             pass
-        time_px = min(len(time_text), 5) * 6
+        time_px = len(time_text) * 6
 
-        # Volume text immediately to the right of time, with a space
-        vol_text = self._format_oled_header(extra, settings)
         vol_x = time_px + 6  # 1-char spacer
         try:
             vol_px = min(len(vol_text), 6) * 6
             if self._volume_mode_active:
                 # Invert only the volume region
-                if hasattr(self.oled, 'fill_rect'):
-                    self.oled.fill_rect(vol_x, 0, max(18, vol_px + 2), 10, 1)
-                else:
-                    for dx in range(max(18, vol_px + 2)):
-                        for dy in range(10):
-                            self.oled.pixel(vol_x + dx, dy, 1)
-                if hasattr(self.oled, 'text'):
-                    self.oled.text(vol_text[:6], vol_x, 0, 0)
+                self._oled_img.paste(1, (vol_x, 0, vol_x + max(18, vol_px + 2), 10))
+                self._oled_text(vol_text[:_OLED_VOL_CHARS], vol_x, 0, 0)
             else:
-                self.oled.text(vol_text[:6], vol_x, 0, 1)
+                self._oled_text(vol_text[:_OLED_VOL_CHARS], vol_x, 0, 1)
         except Exception:
             # Fallback plain draw
             try:
-                self.oled.text(vol_text[:6], vol_x, 0, 1)
+                self._oled_text(vol_text[:_OLED_VOL_CHARS], vol_x, 0, 1)
             except Exception:
                 pass
         left_px_end = vol_x + min(len(vol_text), 20) * 6
 
-        # Right: Signal rectangle fill (progress bar)
-        # Determine signal quality in [0,1]
-        try:
-            quality = float(extra.get('signal_quality', 0.0))
-        except Exception:
-            quality = 0.0
-        if quality < 0.0:
-            quality = 0.0
-        elif quality > 1.0:
-            quality = 1.0
-
-        bar_w = 40  # total width of bar
-        bar_h = 8   # height of bar
         margin_right = 2
         x_bar = max(0, 128 - bar_w - margin_right)
         y_bar = 0
-        self._draw_progress_bar(x_bar, y_bar, bar_w, bar_h, quality)
+        self._draw_progress_bar(x_bar, y_bar, bar_w, bar_h, inner_w)
 
         # Optional: lock icon just to the left of bar if there's room
-        if extra.get('signal_locked'):
+        if locked:
             x_lock = x_bar - 10
             if x_lock > left_px_end + 2:
                 self._draw_oled_header_lock_safe(x_lock)
 
+        self._oled_hdr_sig = sig
+        self._oled_hdr_img = self._oled_img.crop((0, 0, _OLED_WIDTH, 10))
+
     def _draw_oled_header_lock_safe(self, x_lock: int):
         """Helper to draw lock icon safely without raising exceptions."""
         try:
@@ -499,23 +1618,11 @@ class DisplayManager:
         except Exception:
             pass
 
-    def _draw_progress_bar(self, x: int, y: int, w: int, h: int, frac: float):
-        """Draw an outline rectangle and fill horizontally to fraction [0,1]."""
+    def _draw_progress_bar(self, x: int, y: int, w: int, h: int, inner_w: int):
+        """Draw an outline rectangle filled inner_w pixels from the left."""
         try:
-            # Outline
-            if hasattr(self.oled, 'rect'):
-                self.oled.rect(x, y, w, h, 1)
-            # Inner fill
-            inner_w = max(0, min(w - 2, int((w - 2) * frac)))
-            if inner_w <= 0 or h <= 2:
-                return
-            if hasattr(self.oled, 'fill_rect'):
-                self.oled.fill_rect(x + 1, y + 1, inner_w, h - 2, 1)
-            else:
-                # Fallback: fill manually with pixels
-                for dx in range(inner_w):
-                    for dy in range(h - 2):
-                        self.oled.pixel(x + 1 + dx, y + 1 + dy, 1)
+            # Paste the prebuilt bar for this fill level (outline + inner fill)
+            self._oled_img.paste(_progress_bar_image(w, h, inner_w), (x, y))
         except Exception:
             # Ignore drawing errors on systems without OLED
             pass
@@ -532,6 +1639,8 @@ class DisplayManager:
 
             # Create main group once (no backgrounds; text only)
             self._st7789_splash = displayio.Group()
+            self._st7789_label_text = {}
+            self._st7789_frame_sig = None
 
             # Create text labels (reuse these, just update text)
             # Top row: TIME VOL [LOCK] SIGNAL BAR
@@ -558,20 +1667,16 @@ class DisplayManager:
             self._sig_palette[0] = 0x000000
             self._sig_palette[1] = 0xFFFFFF
             # Draw outline (1px border)
-            for x in range(self._sig_w):
-                self._sig_bitmap[x, 0] = 1
-                self._sig_bitmap[x, self._sig_h - 1] = 1
-            for y in range(self._sig_h):
-                self._sig_bitmap[0, y] = 1
-                self._sig_bitmap[self._sig_w - 1, y] = 1
+            _blit_mask(self._sig_bitmap, _outline_mask(self._sig_w, self._sig_h), self._sig_w, self._sig_h)
+            # Interior starts empty; _update_st7789_display() grows/shrinks it from here
+            self._sig_inner_w = 0
             self._sig_tile = displayio.TileGrid(
                 self._sig_bitmap, pixel_shader=self._sig_palette, x=self._sig_x, y=self._sig_y
             )
             self._st7789_splash.append(self._sig_tile)
 
             # Lock indicator as bitmap (larger) with transparent background
-            lock_w, lock_h = 12, 12
-            self._lock_bitmap = displayio.Bitmap(lock_w, lock_h, 2)
+            self._lock_bitmap = displayio.Bitmap(_LOCK_ICON_W, _LOCK_ICON_H, 2)
             self._lock_palette = displayio.Palette(2)
             # index 0 transparent, 1 white
             self._lock_palette[0] = 0x000000
@@ -580,27 +1685,13 @@ class DisplayManager:
                 self._lock_palette.make_transparent(0)
             except Exception:
                 pass
-            # Draw lock: outer rectangle and shackle
-            # Body border
-            for x in range(2, 10):
-                self._lock_bitmap[x, 5] = 1
-                self._lock_bitmap[x, 10] = 1
-            for y in range(6, 10):
-                self._lock_bitmap[2, y] = 1
-                self._lock_bitmap[9, y] = 1
-            # Keyhole
-            self._lock_bitmap[6, 8] = 1
-            # Shackle
-            for x in range(3, 9):
-                self._lock_bitmap[x, 4] = 1
-            self._lock_bitmap[3, 3] = 1
-            self._lock_bitmap[8, 3] = 1
-            self._lock_bitmap[4, 2] = 1
-            self._lock_bitmap[7, 2] = 1
+            # Draw lock: outer rectangle, keyhole and shackle (prebuilt mask)
+            _blit_mask(self._lock_bitmap, _LOCK_ICON_MASK, _LOCK_ICON_W, _LOCK_ICON_H)
             self._st7789_lock = displayio.TileGrid(
                 self._lock_bitmap, pixel_shader=self._lock_palette, x=-20, y=5
             )
             self._st7789_splash.append(self._st7789_lock)
+            self._st7789_lock_shown = False
 
             # Move talkgroup up directly below header
             self._st7789_text_labels["tgid"] = label.Label(
@@ -641,7 +1732,29 @@ class DisplayManager:
             logging.error(f"Error initializing ST7789 layout: {e}")
             return False
 
-    def _update_st7789_display(self, system, freq, tgid, extra, settings):
+    def _fill_sig_columns(self, x0, x1, value):
+        """Set interior columns [x0, x1) of the displayio signal bitmap to palette index value."""
+        if self._sig_h <= 2 or x0 >= x1:
+            return
+        if bitmaptools is not None:
+            # One native region fill instead of a Python loop per pixel
+            bitmaptools.fill_region(self._sig_bitmap, x0, 1, x1, self._sig_h - 1, value)
+            return
+        bitmap = self._sig_bitmap
+        for x in range(x0, x1):
+            for y in range(1, self._sig_h - 1):
+                bitmap[x, y] = value
+
+    def _set_label(self, name, text):
+        """Set a displayio label's text only when it differs from what the label shows.
+        Each assignment rebuilds the label's glyph tiles and marks its area dirty, even for
+        an identical string, so unchanged labels cost nothing per frame.
+        """
+        if self._st7789_label_text.get(name) != text:
+            self._st7789_text_labels[name].text = text
+            self._st7789_label_text[name] = text
+
+    def _update_st7789_display(self, system, freq, tgid, extra, settings, snap=None):
         """Update the ST7789 display by just changing text content (much faster)."""
         if not self.st7789_available or self.st7789_display is None:
             return False
@@ -650,51 +1763,52 @@ class DisplayManager:
         if self._st7789_splash is None:
             if not self._init_st7789_layout():
                 return False
+        if snap is None:
+            snap = self._snapshot(settings, tgid, extra)
 
         try:
-            from datetime import datetime
-
             # Update text labels only (very fast)
             # Top row updates: TIME VOL LOCK SIGNAL BARS
-            self._st7789_text_labels['time'].text = datetime.now().strftime("%H:%M:%S")
+            self._set_label("time", snap.clock)
+            # Same inputs as the last applied frame (a clock-only tick): nothing else can change
+            sig = (
+                self._frame_identity(snap, system, freq, tgid, extra, settings),
+                snap.volume, snap.tg_info,
+            )
+            if sig == self._st7789_frame_sig:
+                return True
             # Volume (Vxx)
             try:
-                vol_num = int(self._get_volume_percent(settings))
+                vol_num = int(snap.volume)
             except Exception:
                 vol_num = 0
-            self._st7789_text_labels["vol"].text = f"VOL: {vol_num:02d}"
+            self._set_label("vol", _tft_vol_text(vol_num))
             # Signal bar fill and lock icon
-            quality = 0.0
-            try:
-                quality = float(extra.get("signal_quality", 0.0))
-            except Exception:
-                pass
-            # Fill the signal rectangle like OLED
-            # Clear interior
-            for x in range(1, self._sig_w - 1):
-                for y in range(1, self._sig_h - 1):
-                    self._sig_bitmap[x, y] = 0
-            inner_w = max(0, min(self._sig_w - 2, int((self._sig_w - 2) * max(0.0, min(1.0, quality)))))
-            if inner_w > 0 and self._sig_h > 2:
-                for x in range(1, 1 + inner_w):
-                    for y in range(1, self._sig_h - 1):
-                        self._sig_bitmap[x, y] = 1
-            # Lock icon visible only when locked; position just before bars
-            if extra.get("signal_locked"):
-                self._st7789_lock.x = self._sig_x - 18
-            else:
-                # move off-screen
-                self._st7789_lock.x = -20
-
-            system_text = system[:25] if system else "No System"
-            self._st7789_text_labels['system'].text = system_text
+            # Fill the signal rectangle like OLED: only the columns between the old and the
+            # new fill width change (none when the quality bucket is the same)
+            ev = snap.ev
+            inner_w = ev.meter
+            if inner_w != self._sig_inner_w:
+                lo, hi = sorted((self._sig_inner_w, inner_w))
+                self._fill_sig_columns(1 + lo, 1 + hi, 1 if inner_w > self._sig_inner_w else 0)
+                self._sig_inner_w = inner_w
+            # Lock icon visible only when locked; position just before bars.
+            # Moved only when the lock state flips, so an unchanged frame leaves it clean
+            locked = ev.locked
+            if locked != self._st7789_lock_shown:
+                # Off-screen at x=-20 when unlocked
+                self._st7789_lock.x = self._sig_x - 18 if locked else -20
+                self._st7789_lock_shown = locked
+
+            system_text = _fit(system, _TFT_SYSTEM_CHARS, _TFT_NO_SYSTEM)
+            self._set_label("system", system_text)
 
             # Department info
-            department = "Scanning..."
-            encrypted = bool(extra.get('encrypted'))
+            department = _TFT_SCANNING
+            encrypted = ev.encrypted
 
             if tgid and self.talkgroup_manager and not encrypted:
-                tg_info = self.talkgroup_manager.lookup(tgid)
+                tg_info = snap.tg_info
                 if tg_info:
                     department = tg_info['department']
                     description = tg_info['description']
@@ -710,45 +1824,44 @@ class DisplayManager:
                 else:
                     department = f"TGID {tgid} - Unknown"
             elif encrypted:
-                department = "Encrypted"
+                department = _TFT_ENCRYPTED
 
-            self._st7789_text_labels['dept'].text = department[:30]
+            self._set_label("dept", department[:_TFT_DEPT_CHARS])
 
             # Talkgroup info; if no active transmission, show Scanning...
             if tgid:
-                if bool(extra.get("active")):
+                if ev.active:
                     if encrypted:
-                        tag = "Encrypted"
+                        tag = _TFT_ENCRYPTED
                     else:
-                        srcaddr = extra.get("srcaddr", 0)
+                        srcaddr = 0 if ev.srcaddr is None else ev.srcaddr
                         tag = f"TGID: {tgid} | SRC: {srcaddr}"
                 else:
-                    tag = "Scanning..."
+                    tag = _TFT_SCANNING
             else:
-                tag = "Scanning..."
+                tag = _TFT_SCANNING
 
-            self._st7789_text_labels['tgid'].text = tag[:35]
+            self._set_label("tgid", tag[:_TFT_LINE_CHARS])
 
             # Frequency
-            freq_text = f"Freq: {freq:.4f} MHz" if freq else "Freq: --"
-            self._st7789_text_labels['freq'].text = freq_text
+            freq_text = f"Freq: {freq:.4f} MHz" if freq else _TFT_FREQ_NONE
+            self._set_label("freq", freq_text)
 
             # System info
-            nac = extra.get('nac', '--')
-            wacn = extra.get('wacn', '--') 
-            sysid = extra.get('sysid', '--')
-            site_info = f"NAC:{nac} WACN:{wacn} SYS:{sysid}"
-            self._st7789_text_labels['info'].text = site_info[:35]
+            site_info = f"NAC:{ev.nac} WACN:{ev.wacn} SYS:{ev.sysid}"
+            self._set_label("info", site_info[:_TFT_LINE_CHARS])
 
             # Status
-            volume = settings.get('volume_level', 0)
-            mute_status = "MUTE" if settings.get('mute') else f"VOL:{volume}"
-            rec_status = "REC" if settings.get('recording') else ""
+            sv = snap.sv
+            volume = sv.volume_level
+            mute_status = "MUTE" if sv.mute else f"VOL:{volume}"
+            rec_status = "REC" if sv.recording else ""
             status_text = f"{mute_status} | SQL:2"
             if rec_status:
                 status_text += f" | {rec_status}"
-            self._st7789_text_labels['status_text'].text = status_text[:30]
+            self._set_label("status_text", status_text[:_TFT_STATUS_CHARS])
 
+            self._st7789_frame_sig = sig
             return True
 
         except Exception as e:
@@ -759,62 +1872,331 @@ class DisplayManager:
         """Legacy fast displayio update removed (unused)."""
         return False
 
-    def _draw_lock_icon_pil(
-        self, draw: ImageDraw.ImageDraw, x: int, y: int, color=(255, 255, 255)
-    ) -> None:
-        """Draw a small lock icon similar to the displayio bitmap at (x,y)."""
+    def _draw_lock_icon_pil(self, img: Image.Image, x: int, y: int, color=255) -> None:
+        """Draw the 12x12 lock icon (same pixels as the displayio bitmap) at (x,y): one
+        masked paste of the prebuilt _TFT_LOCK_ICON."""
         try:
-            # Body border (12x12 area)
-            for dx in range(2, 10):
-                draw.point((x + dx, y + 5), fill=color)
-                draw.point((x + dx, y + 10), fill=color)
-            for dy in range(6, 10):
-                draw.point((x + 2, y + dy), fill=color)
-                draw.point((x + 9, y + dy), fill=color)
-            # Keyhole
-            draw.point((x + 6, y + 8), fill=color)
-            # Shackle
-            for dx in range(3, 9):
-                draw.point((x + dx, y + 4), fill=color)
-            draw.point((x + 3, y + 3), fill=color)
-            draw.point((x + 8, y + 3), fill=color)
-            draw.point((x + 4, y + 2), fill=color)
-            draw.point((x + 7, y + 2), fill=color)
+            img.paste(color, (x, y), _TFT_LOCK_ICON)
         except Exception:
             pass
 
+    def _remember_text(self, key, text):
+        """Store a formatted TFT string under its input tuple (bounded) and return it."""
+        if len(self._text_cache) >= 128:
+            self._text_cache.clear()
+        self._text_cache[key] = text
+        return text
+
+    def _draw_tft_header(self, time_str, vol_text, inner_w, locked):
+        """Header band: time, volume, signal meter, lock (positions copied from displayio label setup).
+        Redrawn only when one of its inputs changed since the last drawn header.
+        """
+        sig = (time_str, vol_text, inner_w, locked)
+        prev = self._tft_band_sigs.get("header")
+        if prev == sig:
+            return
+        white = 255
+        header_font = self._font_header
+        if prev is not None and prev[1:] == sig[1:] and self._clock_fits_cell(prev[0], time_str, vol_text, header_font):
+            # Only the clock moved: clear and redraw its cell, push just that box
+            self._tft_band_sigs["header"] = sig
+            self._tft_img.paste(0, (0, 0, _TFT_CLOCK_CELL_W, 28))
+            self._tft_text((6, 5), time_str, header_font, white, cache=False)
+            self._mark_tft_dirty(0, 28, 0, _TFT_CLOCK_CELL_W)
+            return
+        self._tft_band_dirty("header", sig, 0, 27)
+        sig_w, sig_h = _TFT_SIG_W, _TFT_SIG_H
+        sig_x, sig_y = self.width - sig_w - 6, 6
+        # Band fill and meter outline never change; paste them prebuilt
+        self._tft_img.paste(
+            _tft_header_chrome(self.width, 28, (sig_x, sig_y, sig_x + sig_w - 1, sig_y + sig_h - 1)), (0, 0)
+        )
+        self._tft_text((6, 5), time_str, header_font, white, cache=False)
+        self._tft_text((70, 5), vol_text, header_font, white)
+        if inner_w > 0 and sig_h > 2:
+            self._tft_img.paste(white, (sig_x + 1, sig_y + 1, sig_x + inner_w + 1, sig_y + sig_h - 1))
+        if locked:
+            self._draw_lock_icon_pil(self._tft_img, sig_x - 18, 5, color=white)
+
+    @staticmethod
+    def _clock_fits_cell(old_time, time_str, vol_text, font) -> bool:
+        """True if both clock strings end inside the clock cell and the volume text starts
+        at or after it, so redrawing the cell alone matches a full header redraw."""
+        if font is None or _text_mask(vol_text, font)[1][0] < 0:
+            return False
+        for text in (old_time, time_str):
+            # Time is drawn at x=6
+            mask, (dx, _) = _transient_mask(text, font)
+            if 6 + dx + mask.width > _TFT_CLOCK_CELL_W:
+                return False
+        return True
+
+    def _tft_clock_tick(self, clock) -> bool:
+        """Fast path for a frame whose inputs match the last pushed one: only the clock moved.
+        Redraws the header band from its recorded inputs and pushes just that window, skipping
+        the text/signature work of a full update. False if the canvas cannot take the shortcut.
+        """
+        header = self._tft_band_sigs.get("header")
+        if (
+            header is None
+            or self._tft_img is None
+            or self._tft_img.size != (self.width, self.height)
+            or self._save_debug_image
+            or not (
+                (getattr(self, "rgb_display_available", False) and self.rgb_display is not None)
+                or self._framebuffer_available
+            )
+        ):
+            return False
+        self._draw_tft_header(clock, *header[1:])
+        return self._push_tft_canvas(self._tft_img)
+
+    def _tft_band_dirty(self, name, sig, top, bottom) -> bool:
+        """Record a band's content signature; True if it differs from the last drawn one.
+        Changed bands also extend the pending push to cover rows top..bottom (inclusive).
+        """
+        if self._tft_band_sigs.get(name) == sig:
+            return False
+        self._tft_band_sigs[name] = sig
+        self._mark_tft_dirty(top, bottom + 1)
+        return True
+
+    def _tft_text(self, xy, text, font, fill, cache=True):
+        """draw.text() onto the TFT canvas via the cached glyph-run masks.
+        Pass cache=False for the seconds clock so it goes through _transient_mask and does
+        not evict the masks of labels that repeat.
+        """
+        if font is None:
+            self._tft_draw.text(xy, text, fill=fill, font=font)
+            return
+        mask, (dx, dy) = (_text_mask if cache else _transient_mask)(text, font)
+        self._tft_img.paste(fill, (xy[0] + dx, xy[1] + dy), mask)
+
+    def _blank_tft_scratch(self):
+        """Return the reusable full-screen RGB frame, filled black in place."""
+        size = (self.width, self.height)
+        if self._tft_scratch is None or self._tft_scratch.size != size:
+            self._tft_scratch = Image.new('RGB', size, color=(0, 0, 0))
+        else:
+            self._tft_scratch.paste((0, 0, 0), (0, 0) + size)
+        return self._tft_scratch
+
+    def _mark_tft_dirty(self, y0, y1, x0=0, x1=None):
+        """Add the canvas box x0..x1 by rows [y0, y1) (full width by default) to the pending push.
+        Boxes are kept separate (e.g. the clock cell and the info footer) unless their rows
+        overlap or lie within _TFT_SPAN_MERGE_GAP of each other; merged boxes take the union.
+        """
+        if x1 is None:
+            x1 = self.width
+        merged = []
+        for box in sorted((self._tft_dirty or []) + [(x0, y0, x1, y1)], key=lambda b: b[1]):
+            if merged and box[1] - merged[-1][3] <= _TFT_SPAN_MERGE_GAP:
+                last = merged[-1]
+                merged[-1] = (min(last[0], box[0]), last[1], max(last[2], box[2]), max(last[3], box[3]))
+            else:
+                merged.append(box)
+        self._tft_dirty = merged
+
+    def _rgb_region_origin(self, box):
+        """Panel-native (x, y) of a canvas box, matching the driver's software rotation."""
+        x0, y0, x1, y1 = box
+        rotation = self.rotation
+        if rotation == 180:
+            return self.width - x1, self.height - y1
+        if rotation == 90:
+            return y0, self.width - x1
+        if rotation == 270:
+            return self.height - y1, x0
+        return x0, y0
+
+    def _rgb_block_writer(self):
+        """Callable(x0, y0, x1, y1, data) writing an address window to the rgb driver, or None.
+        Prefers _spi_block (one SPI transaction per window) and falls back to the driver's
+        _block(), which takes and releases the bus around each of its six writes.
+        """
+        disp = self.rgb_display
+        if (
+            self._tft_direct_spi
+            and getattr(disp, "spi_device", None) is not None
+            and getattr(disp, "dc_pin", None) is not None
+            and getattr(disp, "_RAM_WRITE", None) is not None
+        ):
+            return self._spi_block
+        return getattr(disp, "_block", None)
+
+    def _spi_block(self, x0, y0, x1, y1, data):
+        """CASET/RASET/RAMWR for one window under a single bus lock and chip select,
+        toggling D/C between each command byte and its parameters (same bytes as _block()).
+        Pixel data goes out in self._spi_chunk slices of one memoryview (spidev's bufsiz, at
+        least _SPI_CHUNK): no copies, and each ioctl stays within spidev's buffer so the GIL
+        is handed back between transfers.
+        """
+        disp = self.rgb_display
+        dc = disp.dc_pin
+        chunk = self._spi_chunk
+        writes = (
+            (disp._COLUMN_SET, disp._encode_pos(x0 + disp._X_START, x1 + disp._X_START)),
+            (disp._PAGE_SET, disp._encode_pos(y0 + disp._Y_START, y1 + disp._Y_START)),
+            (disp._RAM_WRITE, data),
+        )
+        with disp.spi_device as spi:
+            for command, params in writes:
+                dc.value = 0
+                spi.write(bytes((command,)))
+                dc.value = 1
+                if len(params) <= chunk:
+                    spi.write(params)
+                    continue
+                view = memoryview(params)
+                for i in range(0, len(view), chunk):
+                    spi.write(view[i:i + chunk])
+
+    def _write_rgb_block(self, block, region, box):
+        """Write the canvas box (already cropped to region) with the driver's _block().
+        Address window + RAMWR of prepacked big-endian RGB565: image() would expand the span
+        to 24-bit RGB and pack it through a Python list (or per-pixel getpixel() without
+        NumPy), which dominates the push on a Pi Zero.
+        """
+        if self.rotation in _ROTATE_TRANSPOSE:
+            region = region.transpose(_ROTATE_TRANSPOSE[self.rotation])
+        x, y = self._rgb_region_origin(box)
+        block(x, y, x + region.width - 1, y + region.height - 1, self._panel_pixels(region))
+
+    def _panel_pixels(self, region):
+        """Big-endian RGB565 bytes of region for RAMWR.
+        With NumPy, gray canvas regions are looked up into one persistent frame-sized array
+        instead of building fresh point/merge/tobytes images on every push. The view is only
+        valid until the next push; writes are synchronous, so the driver is done with it by then.
+        """
+        if np is None or region.mode != "L":
+            return _rgb565_bytes(region, big_endian=True)
+        out = self._tft_pixel_buffer(region.width * region.height)
+        np.take(_RGB565_GRAY_BE, np.asarray(region).reshape(-1), out=out, mode="clip")
+        return memoryview(out.view(np.uint8))
+
+    def _tft_pixel_buffer(self, count):
+        """The first count pixels of the persistent big-endian RGB565 array (at least a frame)."""
+        if self._tft_pixels is None or self._tft_pixels.size < count:
+            self._tft_pixels = np.empty(max(count, self.width * self.height), dtype=">u2")
+        return self._tft_pixels[:count]
+
+    def _blank_rgb_panel(self):
+        """Fill the whole rgb panel black. With NumPy and a block writer this is one fill of
+        the persistent pixel array sent as a single window, instead of composing a black
+        RGB frame and converting it.
+        """
+        block = self._rgb_block_writer()
+        if np is None or block is None:
+            self._show_rgb_frame(self._blank_tft_scratch())
+            return
+        w, h = self._panel_native_width, self._panel_native_height
+        out = self._tft_pixel_buffer(w * h)
+        out.fill(0)
+        block(0, 0, w - 1, h - 1, memoryview(out.view(np.uint8)))
+
+    def _blank_framebuffer(self) -> bool:
+        """Fill the visible framebuffer black in place: one NumPy fill of the mapped pixels
+        when there is a pixel view, else a blit of the black scratch frame."""
+        pixels = self._fb_pixels
+        if pixels is None:
+            return self._blit_framebuffer(self._blank_tft_scratch())
+        pixels[:self.height, :self.width].fill(0)
+        return True
+
+    def _show_rgb_frame(self, img):
+        """Send a whole frame (message, clear) to the rgb driver, as RGB565 when it allows."""
+        block = self._rgb_block_writer()
+        if block is not None:
+            self._write_rgb_block(block, img, (0, 0, self.width, self.height))
+            return
+        try:
+            self.rgb_display.image(img)
+        except Exception:
+            self.rgb_display.display(img)
+
+    def _push_tft_canvas(self, img) -> bool:
+        """Send the canvas boxes changed since the last push to the rgb driver or framebuffer."""
+        boxes = self._tft_dirty
+        if boxes is None:
+            # Nothing on the canvas changed since the last push
+            return True
+        if getattr(self, "rgb_display_available", False) and self.rgb_display is not None:
+            block = self._rgb_block_writer()
+            try:
+                for box in boxes:
+                    region = img if box == (0, 0, self.width, self.height) else img.crop(box)
+                    if block is not None:
+                        self._write_rgb_block(block, region, box)
+                        continue
+                    # adafruit_rgb_display only accepts RGB/RGBA images
+                    region = region.convert("RGB")
+                    x, y = self._rgb_region_origin(box)
+                    try:
+                        self.rgb_display.image(region, x=x, y=y)
+                    except Exception:
+                        # Older drivers without partial blits: send the whole frame once
+                        self.rgb_display.display(img.convert("RGB"))
+                        break
+            except Exception as e:
+                logging.debug(f"RGB ST7789 display push failed: {e}")
+                return False
+        elif self._framebuffer_available:
+            # Memory-mapped: whole rows cost no bus time, so boxes are copied row-wide
+            for _, y0, _, y1 in boxes:
+                if not self._blit_framebuffer(img, y0, y1):
+                    return False
+        else:
+            return False
+        self._tft_dirty = None
+        return True
+
     def _render_rgb_layout_like_displayio(
-        self, system, freq, tgid, extra, settings
+        self, system, freq, tgid, extra, settings, snap=None
     ) -> Image.Image:
-        """Render a PIL image that matches the displayio layout (white text on black, same positions)."""
-        img = Image.new("RGB", (self.width, self.height), color=(0, 0, 0))
-        draw = ImageDraw.Draw(img)
+        """Render a PIL image that matches the displayio layout (white text on black, same positions).
+        The canvas persists between frames; only bands whose content changed are cleared and redrawn.
+        The layout is white-on-black only, so it is drawn in 8-bit grayscale ("L"): a third of the
+        RGB memory traffic with the same anti-aliased text. Callers convert when a driver needs RGB.
+        """
+        size = (self.width, self.height)
+        if self._tft_img is None or self._tft_img.size != size:
+            self._tft_img = Image.new("L", size, color=0)
+            self._tft_draw = ImageDraw.Draw(self._tft_img)
+            self._tft_band_sigs = {}
+            self._mark_tft_dirty(0, self.height)
+        img = self._tft_img
+        if snap is None:
+            snap = self._snapshot(settings, tgid, extra)
+        ev = snap.ev
+
+        # Every input the layout reads; when the canvas already shows them, skip the text
+        # building and band checks. Kept with the band signatures so whatever invalidates
+        # those (new canvas, font change) invalidates this too.
+        frame_sig = (
+            system, freq, tgid, snap.clock, snap.volume, snap.tg_info,
+            ev.active, ev.encrypted, ev.srcaddr, ev.locked, ev.meter, ev.nac, ev.wacn, ev.sysid,
+        )
+        if self._tft_band_sigs.get("frame") == frame_sig:
+            return img
+        self._tft_band_sigs["frame"] = frame_sig
 
         # Top row content
+        time_str = snap.clock
         try:
-            time_str = datetime.now().strftime("%H:%M:%S")
-        except Exception:
-            time_str = "--:--:--"
-        try:
-            vol_num = int(self._get_volume_percent(settings))
+            vol_num = int(snap.volume)
         except Exception:
             vol_num = 0
-        vol_text = f"VOL: {vol_num:02d}"
+        vol_text = _tft_vol_text(vol_num)
 
         # Signal/lock
-        try:
-            quality = float(extra.get("signal_quality", 0.0))
-        except Exception:
-            quality = 0.0
-        quality = max(0.0, min(1.0, quality))
-        locked = bool(extra.get("signal_locked"))
+        locked = ev.locked
 
         # Below header: texts similar to displayio
-        system_text = system[:25] if system else "No System"
-        department = "Scanning..."
-        encrypted = bool(extra.get("encrypted"))
+        system_text = _fit(system, _TFT_SYSTEM_CHARS, _TFT_NO_SYSTEM)
+        department = _TFT_SCANNING
+        encrypted = ev.encrypted
         if tgid and self.talkgroup_manager and not encrypted:
-            tg_info = self.talkgroup_manager.lookup(tgid)
+            tg_info = snap.tg_info
             if tg_info:
                 department = tg_info["department"]
                 description = tg_info["description"]
@@ -827,104 +2209,63 @@ class DisplayManager:
             else:
                 department = f"TGID {tgid} - Unknown"
         elif encrypted:
-            department = "Encrypted"
-        dept_text = department[:30]
+            department = _TFT_ENCRYPTED
+        dept_text = department[:_TFT_DEPT_CHARS]
 
+        # Each talker's radio ID makes a new tag string, drawn once and never again
+        tag_recurs = True
         if tgid:
-            if bool(extra.get("active")):
+            if ev.active:
                 if encrypted:
-                    tag = "Encrypted"
+                    tag = _TFT_ENCRYPTED
                 else:
-                    srcaddr = extra.get("srcaddr", 0)
+                    srcaddr = 0 if ev.srcaddr is None else ev.srcaddr
                     tag = f"TGID: {tgid} | SRC: {srcaddr}"
+                    tag_recurs = False
             else:
-                tag = "Scanning..."
+                tag = _TFT_SCANNING
         else:
-            tag = "Scanning..."
-        tag = tag[:35]
-
-        freq_text = f"Freq: {freq:.4f} MHz" if freq else "Freq: --"
-        nac = extra.get("nac", "--")
-        wacn = extra.get("wacn", "--")
-        sysid = extra.get("sysid", "--")
-        info_text = f"NAC:{nac} WACN:{wacn} SYS:{sysid}"[:35]
-
-        volume = settings.get("volume_level", 0) if settings else 0
-        mute_status = "MUTE" if (settings and settings.get("mute")) else f"VOL:{volume}"
-        rec_status = "REC" if (settings and settings.get("recording")) else ""
-        status_text = f"{mute_status} | SQL:2"
-        if rec_status:
-            status_text += f" | {rec_status}"
-
-        white = (255, 255, 255)
-        # Positions copied from displayio label setup
-        draw.text(
-            (6, 5),
-            time_str,
-            fill=white,
-            font=(
-                self._font_pixel_small or self._font_regular_small or self.font_small
-            ),
-        )
-        draw.text(
-            (70, 5),
-            vol_text,
-            fill=white,
-            font=(
-                self._font_pixel_small or self._font_regular_small or self.font_small
-            ),
-        )
-
-        # Signal rectangle (outline + horizontal fill)
-        sig_w, sig_h = 40, 10
-        sig_x, sig_y = self.width - sig_w - 6, 6
-        draw.rectangle(
-            (sig_x, sig_y, sig_x + sig_w - 1, sig_y + sig_h - 1), outline=white
-        )
-        inner_w = max(0, min(sig_w - 2, int((sig_w - 2) * quality)))
-        if inner_w > 0 and sig_h > 2:
-            draw.rectangle(
-                (sig_x + 1, sig_y + 1, sig_x + inner_w, sig_y + sig_h - 2), fill=white
-            )
-
-        if locked:
-            self._draw_lock_icon_pil(draw, sig_x - 18, 5, color=white)
-
-        # Content texts
+            tag = _TFT_SCANNING
+        tag = tag[:_TFT_LINE_CHARS]
+
+        freq_text = f"Freq: {freq:.4f} MHz" if freq else _TFT_FREQ_NONE
+        nac, wacn, sysid = ev.nac, ev.wacn, ev.sysid
+        info_key = ("info", nac, wacn, sysid)
+        info_text = self._text_cache.get(info_key)
+        if info_text is None:
+            info_text = self._remember_text(info_key, f"NAC:{nac} WACN:{wacn} SYS:{sysid}"[:_TFT_LINE_CHARS])
+
+        white = 255
+        black = 0
+        w = self.width
+
+        # Signal meter fill width (outline + horizontal fill, see _draw_tft_header)
+        inner_w = ev.meter
+        self._draw_tft_header(time_str, vol_text, inner_w, locked)
+
+        # Content bands, one per text line; each is blanked with a C paste fill
+        # (paste boxes are end-exclusive)
         # Talkgroup: use medium font to avoid oversized appearance
-        draw.text(
-            (10, 30), tag, fill=white, font=self.font("DejaVuSansCondensed-Bold.ttf", 16)
-        )
-        draw.text(
-            (10, 50),
-            system_text,
-            fill=white,
-            font=(self._font_regular_med or self.font_med),
-        )
-        draw.text(
-            (10, 70),
-            dept_text,
-            fill=white,
-            font=(self._font_regular_med or self.font_med),
-        )
-        draw.text(
-            (10, 90),
-            freq_text,
-            fill=white,
-            font=self.font("DejaVuSansMono-Oblique.ttf", 16),
-        )
-        draw.text(
-            (10, self.height - 10),
-            info_text,
-            fill=white,
-            font=(self._font_pixel_small or self.font_med),
-        )
-        # draw.text(
-        #     (10, self.height - 15),
-        #     status_text[:30],
-        #     fill=white,
-        #     font=(self._font_regular_med or self.font_med),
-        # )
+        if self._tft_band_dirty("tag", tag, 28, 49):
+            img.paste(black, (0, 28, w, 50))
+            if tag_recurs:
+                self._tft_text((10, 30), tag, self._font_tag, white)
+            else:
+                # One-off line: a single layout+raster straight onto the canvas, rather than
+                # a measuring pass plus a raster into a mask that is never pasted again
+                self._tft_draw.text((10, 30), tag, fill=white, font=self._font_tag)
+        if self._tft_band_dirty("system", system_text, 50, 69):
+            img.paste(black, (0, 50, w, 70))
+            self._tft_text((10, 50), system_text, self._font_body, white)
+        if self._tft_band_dirty("dept", dept_text, 70, 89):
+            img.paste(black, (0, 70, w, 90))
+            self._tft_text((10, 70), dept_text, self._font_body, white)
+        if self._tft_band_dirty("freq", freq_text, 90, 111):
+            img.paste(black, (0, 90, w, 112))
+            self._tft_text((10, 90), freq_text, self._font_freq, white)
+        if self._tft_band_dirty("info", info_text, self.height - 12, self.height - 1):
+            img.paste(black, (0, self.height - 12, w, self.height))
+            self._tft_text((10, self.height - 10), info_text, self._font_info, white)
 
         return img
 
@@ -943,21 +2284,22 @@ class DisplayManager:
         else:
             logging.warning(f"Invalid rotation angle {angle}, must be 0, 90, 180, or 270")
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _font(path, size):
+        """Load a truetype font, memoized per (path, size) (LRU, 32 entries).
+        Every loader goes through here, so the same face at the same size is one shared
+        FreeTypeFont and the glyph-mask caches keyed on it are shared too.
+        """
+        return ImageFont.truetype(path, size)
+
     def _load_font(self, size=16):
         """Load font with fallbacks"""
-        font_paths = [
-            f"/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            f"/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            f"/System/Library/Fonts/Arial.ttf",  # macOS
-            f"/Windows/Fonts/arial.ttf"  # Windows
-        ]
-
-        for font_path in font_paths:
+        if self._FONT_PATH:
             try:
-                if os.path.exists(font_path):
-                    return ImageFont.truetype(font_path, size)
+                return self._font(self._FONT_PATH, size)
             except Exception as e:
-                logging.debug(f"Could not load font {font_path}: {e}")
+                logging.debug(f"Could not load font {self._FONT_PATH}: {e}")
 
         # Fallback to default
         try:
@@ -970,7 +2312,7 @@ class DisplayManager:
         for path in candidates:
             try:
                 if path and os.path.exists(path):
-                    return ImageFont.truetype(path, size)
+                    return self._font(path, size)
             except Exception as e:
                 logging.debug(f"Could not load font {path}: {e}")
         # As last resort use default
@@ -983,21 +2325,25 @@ class DisplayManager:
         """Resolve a font name to a full path. Accepts names with or without .ttf.
         Searches common system font directories (focus on DejaVu on Raspberry Pi).
         Case-insensitive match is attempted if exact case fails.
+        Index hits are returned without touching the disk, and names found nowhere are
+        remembered so repeated lookups of a missing font skip the directory probes.
         """
         if not name:
             return None
         # Absolute path provided
         if os.path.isabs(name) and os.path.exists(name):
             return name
-        # Use scanned index if available
-        try:
-            if hasattr(self, "_font_index"):
-                key = name if name.lower().endswith(".ttf") else f"{name}.ttf"
-                cand = self._font_index.get(key.lower())
-                if cand and os.path.exists(cand):
-                    return cand
-        except Exception:
-            pass
+        # Use the scanned index (checked against the dir mtimes at startup)
+        key = name if name.lower().endswith(".ttf") else f"{name}.ttf"
+        cand = getattr(self, "_font_index", {}).get(key.lower())
+        if cand:
+            return cand
+        if name in self._missing_fonts:
+            return None
+        if getattr(self, "_font_index", None):
+            # The index already lists every .ttf in the search dirs, case-folded
+            self._missing_fonts.add(name)
+            return None
         # Build candidate filenames (with and without extension)
         base_with_ext = name if name.lower().endswith(".ttf") else f"{name}.ttf"
         # Try direct joins
@@ -1021,25 +2367,55 @@ class DisplayManager:
                         pass
             except Exception:
                 pass
+        self._missing_fonts.add(name)
         return None
 
     def _scan_available_fonts(self):
+        """Index the .ttf files in the search dirs by lowercase filename.
+        The result is kept in _FONT_INDEX_CACHE keyed by each dir's mtime (adding or
+        removing a font changes it), so later startups skip the directory listings.
+        """
+        key = []
+        for dir_path in self._font_search_dirs:
+            try:
+                key.append([dir_path, os.stat(dir_path).st_mtime_ns])
+            except OSError:
+                pass
+        try:
+            with open(_FONT_INDEX_CACHE) as f:
+                cached = json.load(f)
+            if cached.get("key") == key:
+                self._font_index = dict(cached["index"])
+                self._font_available_names = list(cached["names"])
+                return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
         index = {}
         names = []
         for dir_path in self._font_search_dirs:
             try:
-                for entry in os.listdir(dir_path):
-                    try:
-                        if entry.lower().endswith(".ttf"):
-                            full = os.path.join(dir_path, entry)
-                            index[entry.lower()] = full
-                            names.append(os.path.splitext(entry)[0])
-                    except Exception:
-                        pass
-            except Exception:
+                # scandir's entries carry the file type from the directory read: no stat per file
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.name.lower().endswith(".ttf") and entry.is_file():
+                                index[entry.name.lower()] = entry.path
+                                names.append(os.path.splitext(entry.name)[0])
+                        except OSError:
+                            pass
+            except OSError:
                 pass
         self._font_index = index
         self._font_available_names = sorted(set(names))
+        try:
+            os.makedirs(os.path.dirname(_FONT_INDEX_CACHE), exist_ok=True)
+            tmp = f"{_FONT_INDEX_CACHE}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump({"key": key, "index": index, "names": self._font_available_names}, f)
+            os.replace(tmp, _FONT_INDEX_CACHE)
+        except OSError as e:
+            logging.debug(f"Could not write font index cache: {e}")
 
     def available_fonts(self):
         try:
@@ -1060,7 +2436,7 @@ class DisplayManager:
                 return self._font_cache[key]
             path = self._resolve_font_path(name)
             if path and os.path.exists(path):
-                font = ImageFont.truetype(path, size)
+                font = self._font(path, size)
             else:
                 font = ImageFont.load_default()
             self._font_cache[key] = font
@@ -1085,6 +2461,15 @@ class DisplayManager:
         except Exception:
             return default or self.font_med
 
+    def _resolve_tft_fonts(self):
+        """Pick the TFT canvas fonts (with their fallbacks) once per font load, so drawing a
+        band reads one attribute instead of an or-chain or a font() name lookup."""
+        self._font_header = self._font_pixel_small or self._font_regular_small or self.font_small
+        self._font_tag = self.font("DejaVuSansCondensed-Bold.ttf", 16)
+        self._font_body = self._font_regular_med or self.font_med
+        self._font_freq = self.font("DejaVuSansMono-Oblique.ttf", 16)
+        self._font_info = self._font_pixel_small or self.font_med
+
     def apply_font_settings(self, settings):
         """Load and cache regular, bold, and condensed fonts based on settings.
         Expected settings keys (optional):
@@ -1170,169 +2555,232 @@ class DisplayManager:
             self.font_small = self._font_regular_small or self.font_small
             self.font_med = self._font_regular_med or self.font_med
             self.font_large = self._font_regular_large or self.font_large
+            # The TFT worker reads the resolved fonts and band signatures while rendering
+            with self._tft_lock:
+                self._resolve_tft_fonts()
+                # Fonts changed: force every TFT band to be redrawn
+                self._tft_band_sigs = {}
         except Exception as e:
             logging.debug(f"apply_font_settings failed: {e}")
 
-    def _get_scrolling_text(self, text, max_width=20):
-        """Get scrolling text if text is longer than max_width"""
-        import time
-
+    def _get_scrolling_text(self, text, max_width=20, now=None):
+        """Get scrolling text if text is longer than max_width.
+        now: the frame's timestamp (snapshot time), so scrolling needs no clock read of its own.
+        """
         if len(text) <= max_width:
             return text
+        self._oled_scrolling = True
 
-        # Check if enough time has passed for next scroll step
-        current_time = time.time()
-        if current_time - self.last_scroll_time < self.scroll_delay:
-            # Return current position
-            if hasattr(self, 'current_scroll_text') and self.current_scroll_text:
-                return self.current_scroll_text[:max_width]
+        windows = _scroll_windows(text, max_width)
+        if now is None:
+            now = time.time()
+        if text != self._scroll_text:
+            # New label: start from its first window
+            self._scroll_text = text
+            self.scroll_offset = 0
+            self.last_scroll_time = now
+        elif now - self.last_scroll_time >= self.scroll_delay:
+            self.last_scroll_time = now
+            self.scroll_offset = (self.scroll_offset + 1) % len(windows)
+
+        self.current_scroll_text = windows[self.scroll_offset]
+        return self.current_scroll_text
+
+    def _snapshot(self, settings, tgid=None, extra=None):
+        """Read the per-frame environment (clock, volume, talkgroup info) once.
+        Both displays draw from this, so they agree and the volume cache and the
+        talkgroup table are each probed once per frame. The volume is polled at the
+        configured rate during a transmission or volume adjustment, less often when idle.
+        """
+        tg_info = None
+        if tgid and self.talkgroup_manager:
+            # Same talkgroup and table as last frame: reuse the lookup
+            key = (tgid, getattr(self.talkgroup_manager, "version", None))
+            if key == self._tg_lookup[0]:
+                tg_info = self._tg_lookup[1]
             else:
-                return text[:max_width]
-
-        # Update scroll position
-        self.last_scroll_time = current_time
-
-        # Add padding to create smooth scrolling
-        padded_text = text + "   "  # 3 spaces padding
-        text_len = len(padded_text)
-
-        # Calculate scroll position
-        if text_len <= max_width:
-            scrolled_text = padded_text
-        else:
-            # Scroll back and forth
-            max_offset = text_len - max_width
-
-            if self.scroll_direction == 1:  # Scrolling right
-                self.scroll_offset += 1
-                if self.scroll_offset >= max_offset:
-                    self.scroll_direction = -1  # Start scrolling back
-                    # Pause at the end for readability
-                    self.scroll_delay = 1.0
-                else:
-                    self.scroll_delay = 0.5
-            else:  # Scrolling left
-                self.scroll_offset -= 1
-                if self.scroll_offset <= 0:
-                    self.scroll_direction = 1  # Start scrolling forward
-                    # Pause at the beginning for readability
-                    self.scroll_delay = 1.0
-                else:
-                    self.scroll_delay = 0.5
+                tg_info = self.talkgroup_manager.lookup(tgid)
+                self._tg_lookup = (key, tg_info)
+        ev = _extra_view(extra)
+        ttl = float(self._vol_poll_interval)
+        if not (self._volume_mode_active or ev.active):
+            ttl = max(ttl, _VOL_IDLE_TTL)
+        now = time.time()
+        return _FrameSnapshot(
+            now=now, clock=self._clock_text(now),
+            volume=self._get_volume_percent(settings, ttl), tg_info=tg_info, ev=ev,
+            sv=_settings_view(settings),
+        )
 
-            scrolled_text = padded_text[self.scroll_offset:self.scroll_offset + max_width]
+    def _note_frame_change(self, key, now):
+        """Bump the frame version and record the gap since the visible inputs last changed."""
+        if key == self._last_change_key:
+            return
+        self._frame_version += 1
+        if self._last_change_time is not None:
+            self._change_intervals.append(now - self._last_change_time)
+        self._last_change_key = key
+        self._last_change_time = now
+
+    def _frame_identity(self, snap, system, freq, tgid, extra, settings):
+        """What the displays compare to skip unchanged frames: the snapshot's frame version
+        when it came through update(), else the frame key itself.
+        """
+        if snap.version is not None:
+            return snap.version
+        return self._frame_key(system, freq, tgid, snap.ev, snap.sv)
+
+    def _refresh_pace(self, active):
+        """Minimum seconds between pushes for the current activity level.
+        Transmissions and volume adjustments run at the configured rates (0.0); otherwise
+        rarely changing content is pushed less often, up to _PACE_MAX_INTERVAL.
+        """
+        if active or self._volume_mode_active or not self._change_intervals:
+            return 0.0
+        return min(median(self._change_intervals) * 0.5, _PACE_MAX_INTERVAL)
 
-        self.current_scroll_text = scrolled_text
-        return scrolled_text
+    def _tft_has_output(self, settings) -> bool:
+        """True if a TFT frame has somewhere to go: an enabled panel, a framebuffer that is
+        mapped or being waited for, or a requested debug dump.
+        """
+        settings = settings or {}
+        if not settings.get('tft_enable', True):
+            return False
+        return bool(
+            self.st7789_available
+            or self._fb_wanted
+            or settings.get('dump_frame', settings.get('save_debug_image', False))
+        )
 
     def update(self, system, freq, tgid, extra, settings):
-        # Update OLED first for better perceived responsiveness
-        if self.oled_available:
-            self.update_oled(system, freq, tgid, extra, settings)
+        # Frames go only to displays that can show them; with neither present the volume
+        # and talkgroup lookups are skipped as well
+        tft = self._tft_has_output(settings)
+        if not (tft or self.oled_available):
+            return
+        snap = self._snapshot(settings, tgid, extra)
+        # Workers get their own copy of extra so the caller can keep mutating its dict
+        extra = dict(extra or {})
+        self._note_frame_change(self._frame_key(system, freq, tgid, snap.ev, snap.sv), snap.now)
+        snap = snap._replace(pace=self._refresh_pace(snap.ev.active), version=self._frame_version)
+        # Both workers get the same frame; neither mutates extra or the snapshot
+        frame = (system, freq, tgid, extra, settings, snap)
         # Optionally skip TFT updates during rapid user interactions
-        if time.time() >= self._skip_tft_until:
-            self.update_tft(system, freq, tgid, extra, settings)
+        if tft and snap.now >= self._skip_tft_until:
+            self._tft_frames.submit(frame)
+        if self.oled_available:
+            self._oled_frames.submit(frame)
 
-    def update_tft(self, system, freq, tgid, extra, settings):
+    def update_tft(self, system, freq, tgid, extra, settings, snap=None):
         """Update TFT display with current scanner information"""
         try:
+            if snap is None:
+                snap = self._snapshot(settings, tgid, extra)
             # Settings to control TFT activity
-            tft_enabled = settings.get('tft_enable', True)
-            if not tft_enabled:
+            sv = snap.sv
+            if not sv.tft_enable:
                 return
-            update_interval = float(settings.get('tft_update_interval', self._tft_min_interval))
+            self._save_debug_image = sv.dump_frame
+            update_interval = float(
+                self._tft_min_interval if sv.tft_update_interval is None else sv.tft_update_interval
+            )
+            update_interval = max(update_interval, snap.pace)
+
+            # Nothing visible changed since the last push: only redraw once a second for the clock
+            now_ts = snap.now
+            frame_key = self._frame_identity(snap, system, freq, tgid, extra, settings)
+            if frame_key == self._last_tft_key:
+                if (now_ts - self._last_tft_push) < 1.0:
+                    return
+                if self._tft_clock_tick(snap.clock):
+                    self._last_tft_push = now_ts
+                    return
+
+            # Every extra field this frame needs, coerced once by _snapshot()
+            ev = snap.ev
+            encrypted = ev.encrypted
+            active = ev.active
+            srcaddr = 0 if ev.srcaddr is None else ev.srcaddr
+            last_activity = ev.last_activity
+            nac, wacn, sysid, error = ev.nac, ev.wacn, ev.sysid, ev.error
+            volume = sv.volume_level
+            mute = sv.mute
+            recording = sv.recording
 
             # Precompute all text content for signature/caching (exclude time)
-            system_text = system[:35] if system else "No System"
+            system_text = _fit(system, _SIGNATURE_SYSTEM_CHARS, _TFT_NO_SYSTEM)
 
             # Department/Agency bar
-            department = "Scanning..."
-            dept_color = self.colors['department']
-            encrypted = bool(extra.get('encrypted'))
+            department = _TFT_SCANNING
 
             if tgid and self.talkgroup_manager and not encrypted:
-                tg_info = self.talkgroup_manager.lookup(tgid)
+                tg_info = snap.tg_info
                 if tg_info:
                     department = tg_info['department']
                     description = tg_info['description']
                     if description:
                         department = f"{department} - {description}"
-
-                    # Color code by priority
-                    priority = tg_info.get('priority', 'Medium')
-                    if priority == 'High':
-                        dept_color = self.colors['high_priority']
-                    elif priority == 'Medium':
-                        dept_color = self.colors['medium_priority']
-                    else:
-                        dept_color = self.colors['low_priority']
                 else:
                     department = f"TGID {tgid} - Unknown"
             elif encrypted:
-                department = "Encrypted"
-                dept_color = self.colors['medium_priority']
+                department = _TFT_ENCRYPTED
 
-            dept_text = department[:40] if len(department) > 40 else department
+            dept_text = department[:_SIGNATURE_DEPT_CHARS]
 
             # Talkgroup and frequency info
             if tgid:
                 if encrypted:
-                    tag = "Encrypted"
-                elif extra.get('active'):
+                    tag = _TFT_ENCRYPTED
+                elif active:
                     # Active transmission - show source address
-                    srcaddr = extra.get('srcaddr', 0)
                     tag = f"TGID: {tgid} | SRC: {srcaddr}"
                 else:
                     # Recent activity
-                    last_activity = extra.get('last_activity')
                     if last_activity:
                         tag = f"TGID: {tgid} (last: {last_activity}s)"
                     else:
                         tag = f"TGID: {tgid}"
             else:
-                tag = "Scanning..."
-
-            freq_text = f"Freq: {freq:.4f} MHz" if freq else "Freq: --"
-
-            # System info
-            nac = extra.get('nac', '--')
-            wacn = extra.get('wacn', '--')
-            sysid = extra.get('sysid', '--')
-
-            site_info = f"NAC: {nac} | WACN: {wacn} | SYS: {sysid}"
-            if extra.get('error'):
-                site_info += f" | ERR: {extra.get('error')}"
-
-            # Additional system info
-            if settings.get('show_debug'):
-                debug_info = f"Auto: {'ON' if settings.get('auto_scan') else 'OFF'} | "
-                debug_info += f"Priority: {'ON' if settings.get('priority_scan') else 'OFF'}"
-
-            # Status bar
-            volume = settings.get('volume_level', 0)
-            mute_status = "MUTE" if settings.get('mute') else f"VOL:{volume}"
-            rec_status = "REC" if settings.get('recording') else ""
-            status_text = f"{mute_status} | SQL:2"
-            if rec_status:
-                status_text += f" | {rec_status}"
+                tag = _TFT_SCANNING
+
+            freq_text = f"Freq: {freq:.4f} MHz" if freq else _TFT_FREQ_NONE
+
+            # System info and status bar strings only change with their inputs
+            cache = self._text_cache
+            site_key = ("site", nac, wacn, sysid, error)
+            site_info = cache.get(site_key)
+            if site_info is None:
+                site_info = f"NAC: {nac} | WACN: {wacn} | SYS: {sysid}"
+                if error:
+                    site_info += f" | ERR: {error}"
+                site_info = self._remember_text(site_key, site_info)
+            status_key = ("status", mute, volume, recording)
+            status_text = cache.get(status_key)
+            if status_text is None:
+                status_text = self._remember_text(
+                    status_key,
+                    f"{'MUTE' if mute else f'VOL:{volume}'} | SQL:2{' | REC' if recording else ''}",
+                )
 
             # Build a signature of visible content (exclude timestamp so time alone won't trigger)
             signature = (system_text, dept_text, tag, freq_text, site_info, status_text)
-            now_ts = time.time()
             if signature == self._last_tft_signature and (now_ts - self._last_tft_push) < update_interval:
                 # No relevant changes and not time for a scheduled refresh
                 return
             self._last_tft_signature = signature
 
             # Proceed to draw only when content changed
-            # If RGB path is active, render a PIL image that mirrors the displayio layout
+            if self._fb_wanted and not self._framebuffer_available:
+                self._reopen_framebuffer()
+            # If RGB or framebuffer path is active (or a debug dump is requested),
+            # render a PIL image that mirrors the displayio layout
             img = None
             if (
                 getattr(self, "rgb_display_available", False)
                 and self.rgb_display is not None
-            ):
+            ) or self._framebuffer_available or self._save_debug_image:
                 img = self._render_rgb_layout_like_displayio(
-                    system, freq, tgid, extra, settings
+                    system, freq, tgid, extra, settings, snap
                 )
 
             # Note: ST7789 rotation is handled in display initialization
@@ -1345,32 +2793,31 @@ class DisplayManager:
                     getattr(self, "rgb_display_available", False)
                     and self.rgb_display is not None
                 ):
-                    # Pi-friendly RGB driver: push PIL image matching the displayio layout
-                    try:
-                        if img is not None:
-                            try:
-                                self.rgb_display.image(img)
-                            except Exception:
-                                self.rgb_display.display(img)
-                            pushed = True
-                        else:
-                            pushed = False
-                    except Exception as e:
-                        logging.debug(f"RGB ST7789 display push failed: {e}")
-                        pushed = False
+                    # Pi-friendly RGB driver: push the changed rows of the PIL canvas
+                    pushed = img is not None and self._push_tft_canvas(img)
                 else:
                     # displayio driver path
                     pushed = self._update_st7789_display(
-                        system, freq, tgid, extra, settings
+                        system, freq, tgid, extra, settings, snap
                     )
                 if pushed:
                     self._last_tft_push = now_ts
-                else:
-                    # Fallback to saving image file for debugging
-                    img.save(self.image_path)
-            else:
-                # No ST7789 display; save image file for debugging/development
-                img.save(self.image_path)
+                    self._last_tft_key = frame_key
+            elif self._framebuffer_available and (now_ts - self._last_tft_push) >= update_interval:
+                # Framebuffer TFT: write changed rows directly into the mapped device memory
+                pushed = img is not None and self._push_tft_canvas(img)
+                if pushed:
+                    self._last_tft_push = now_ts
+                    self._last_tft_key = frame_key
+
+            if (
+                img is not None
+                and self._save_debug_image
+                and now_ts - self._last_debug_dump >= _DEBUG_DUMP_INTERVAL
+            ):
+                # Troubleshooting dump of the composed frame; nothing on the display path reads it
+                img.save(self.image_path, "BMP")
+                self._last_debug_dump = now_ts
 
             # If a lot of updates fail, temporarily slow down TFT to reduce bus contention
             try:
@@ -1388,7 +2835,7 @@ class DisplayManager:
         except Exception as e:
             logging.error(f"Error updating TFT display: {e}")
 
-    def update_oled(self, system, freq, tgid, extra=None, settings=None):
+    def update_oled(self, system, freq, tgid, extra=None, settings=None, snap=None):
         """Update OLED display with transmission information"""
         if not self.oled_available or self.oled is None:
             # Try lazy reinit if previously failed and backoff elapsed
@@ -1399,26 +2846,32 @@ class DisplayManager:
         if extra is None:
             extra = {}
 
+        if snap is None:
+            snap = self._snapshot(settings, tgid, extra)
+
         # Check OLED refresh rate throttling
-        now = time.time()
+        now = snap.now
         if settings:
-            oled_refresh_rate = settings.get('oled_refresh_rate', 20)
-            oled_interval = 1.0 / max(1, oled_refresh_rate)  # Prevent division by zero
+            sv = snap.sv
+            oled_interval = 1.0 / max(1, sv.oled_refresh_rate)  # Prevent division by zero
 
             # Update scroll speed from settings
-            self.scroll_delay = settings.get('oled_scroll_speed', 0.2)
+            self.scroll_delay = sv.oled_scroll_speed
             # Update volume poll interval to make volume number react faster when user turns encoder
             try:
-                self._vol_poll_interval = float(settings.get('volume_poll_interval', 0.2))
+                self._vol_poll_interval = float(sv.volume_poll_interval)
             except Exception:
                 self._vol_poll_interval = 0.2
             # Update grace period during which UI hint overrides system value
             try:
-                self._vol_hint_grace = float(settings.get('volume_hint_grace', 0.6))
+                self._vol_hint_grace = float(sv.volume_hint_grace)
             except Exception:
                 self._vol_hint_grace = 0.6
         else:
             oled_interval = self._oled_min_interval
+        if not self._oled_scrolling:
+            # A scrolling label keeps the configured rate so it moves at scroll_delay
+            oled_interval = max(oled_interval, snap.pace)
 
         # Throttle OLED updates based on refresh rate setting
         if now - self._last_oled_update < oled_interval:
@@ -1426,20 +2879,32 @@ class DisplayManager:
 
         self._last_oled_update = now
 
+        # Same inputs as the last drawn frame and no scrolling label: keep the panel as is,
+        # redrawing once a second so the header clock stays current
+        frame_key = self._frame_identity(snap, system, freq, tgid, extra, settings)
+        if (
+            frame_key == self._last_oled_key
+            and not self._oled_scrolling
+            and now - self._last_oled_draw < 1.0
+        ):
+            return
+
         try:
-            self.oled.fill(0)
+            self._oled_scrolling = False
+            self._oled_canvas()
 
             # Check if there's an active transmission with a radio ID
-            srcaddr = extra.get('srcaddr')
-            active_transmission = extra.get('active') and srcaddr is not None
-            encrypted = bool(extra.get('encrypted'))
+            ev = snap.ev
+            srcaddr = ev.srcaddr
+            active_transmission = ev.active and srcaddr is not None
+            encrypted = ev.encrypted
 
             if active_transmission and tgid:
                 # ACTIVE TRANSMISSION - Show 3-line format
 
                 # Line 1: Custom header
                 # Draw composed header: SID/VOL + lock icon + bars
-                self._draw_oled_header(extra, settings)
+                self._draw_oled_header(ev, settings, snap.volume, snap.clock)
 
                 # Line 2: TALKGROUP (get full description with scrolling)
                 if encrypted:
@@ -1447,21 +2912,21 @@ class DisplayManager:
                 else:
                     talkgroup_text = f"TG {tgid}"
                     if self.talkgroup_manager:
-                        tg_info = self.talkgroup_manager.lookup(tgid)
+                        tg_info = snap.tg_info
                         if tg_info:
                             label = tg_info.get('name') or tg_info.get('description')
                             if label:
-                                talkgroup_text = self._get_scrolling_text(label, 20)
+                                talkgroup_text = self._get_scrolling_text(label, 20, now)
                             elif tg_info.get('department'):
                                 dept_text = f"{tg_info['department']} {tgid}"
-                                talkgroup_text = self._get_scrolling_text(dept_text, 20)
+                                talkgroup_text = self._get_scrolling_text(dept_text, 20, now)
 
-                self.oled.text(talkgroup_text, 0, 10, 1)
+                self._oled_text(talkgroup_text, 0, 10, 1)
 
                 # Line 3: RADIO ID
                 if not encrypted:
                     radio_text = f"RADIO {srcaddr}"
-                    self.oled.text(radio_text, 0, 20, 1)
+                    self._oled_text(radio_text, 0, 20, 1)
 
                 # Lines 4-6: Reserved for future dual SDR setup
                 # (Currently empty but available)
@@ -1471,22 +2936,24 @@ class DisplayManager:
 
                 # Line 1: Custom header
                 # Draw composed header: SID/VOL + lock icon + bars
-                self._draw_oled_header(extra, settings)
+                self._draw_oled_header(ev, settings, snap.volume, snap.clock)
 
                 # Line 2: Scanning status
-                self.oled.text("SCANNING...", 0, 10, 1)
+                self._oled_text("SCANNING...", 0, 10, 1)
 
                 # Line 3: Connection status
                 if system != "Offline":
-                    if extra.get('last_activity'):
-                        status = f"IDLE {extra.get('last_activity')}s"
+                    if ev.last_activity:
+                        status = f"IDLE {ev.last_activity}s"
                     else:
                         status = "MONITORING"
                 else:
                     status = "OFFLINE"
-                self.oled.text(status, 0, 20, 1)
+                self._oled_text(status, 0, 20, 1)
 
-            self.oled.show()
+            self._oled_push()
+            self._last_oled_key = frame_key
+            self._last_oled_draw = now
             # On success, reset error count
             self._oled_error_count = 0
         except Exception as e:
@@ -1495,7 +2962,14 @@ class DisplayManager:
             self._reinit_oled()
 
     def show_menu_on_oled(self, menu_items, selected_index):
-        """Display menu on OLED"""
+        """Display menu on OLED.
+        Drawn and sent by the OLED worker, so the menu's input loop does not wait on I2C;
+        it replaces any queued status frame, and fast scrolling coalesces to the newest menu.
+        """
+        self._oled_frames.submit((list(menu_items), selected_index), render=self._draw_menu_on_oled)
+
+    def _draw_menu_on_oled(self, menu_items, selected_index):
+        """Render and push a menu frame (OLED worker thread, _oled_lock held)."""
         if not self.oled_available or self.oled is None:
             # Try lazy reinit if previously failed and backoff elapsed
             self._reinit_oled()
@@ -1503,19 +2977,27 @@ class DisplayManager:
             return
 
         try:
-            self.oled.fill(0)
+            self._last_oled_key = None
+            if self._oled_rows is None:
+                # Canvas last held a status frame or message: start from blank rows
+                self._oled_canvas()
+                self._oled_rows = {}
 
-            # Show up to 6 menu items
+            # Show up to 6 menu items; only rows whose text changed are cleared and redrawn
             start_idx = max(0, selected_index - 2)
             end_idx = min(len(menu_items), start_idx + 6)
 
-            for i, item_idx in enumerate(range(start_idx, end_idx)):
-                item = menu_items[item_idx]
-                prefix = "> " if item_idx == selected_index else "  "
-                text = f"{prefix}{item}"[:21]  # Truncate for display
-                self.oled.text(text, 0, i * 10, 1)
-
-            self.oled.show()
+            changed = False
+            for i in range(6):
+                item_idx = start_idx + i
+                text = ""
+                if item_idx < end_idx:
+                    prefix = "> " if item_idx == selected_index else "  "
+                    text = f"{prefix}{menu_items[item_idx]}"[:_OLED_LINE_CHARS]  # Truncate for display
+                changed |= self._oled_row(i * 10, text)
+
+            if changed:
+                self._oled_push()
             self._oled_error_count = 0
         except Exception as e:
             logging.error(f"Error showing menu on OLED: {e}")
@@ -1523,36 +3005,43 @@ class DisplayManager:
 
     def clear(self):
         """Clear both displays"""
+        self._last_oled_key = None
         try:
-            # Clear ST7789 display
-            if self.st7789_available:
-                try:
-                    black_image = Image.new('RGB', (self.width, self.height), color=(0, 0, 0))
-                    if (
-                        getattr(self, "rgb_display_available", False)
-                        and self.rgb_display is not None
-                    ):
-                        try:
+            # Clear ST7789 display (under the TFT lock so the worker cannot draw over it)
+            with self._tft_lock:
+                self._tft_frames.discard()
+                self._last_tft_key = None
+                self._mark_tft_dirty(0, self.height)
+                if self.st7789_available:
+                    try:
+                        if (
+                            getattr(self, "rgb_display_available", False)
+                            and self.rgb_display is not None
+                        ):
                             try:
-                                self.rgb_display.image(black_image)
+                                self._blank_rgb_panel()
                             except Exception:
-                                self.rgb_display.display(black_image)
-                        except Exception:
-                            pass
-                    elif self.st7789_display is not None:
-                        self.st7789_display.display(black_image)
-                except Exception as e:
-                    logging.debug(f"Error clearing ST7789 display: {e}")
+                                pass
+                        elif self.st7789_display is not None:
+                            self.st7789_display.display(self._blank_tft_scratch())
+                    except Exception as e:
+                        logging.debug(f"Error clearing ST7789 display: {e}")
+                elif self._framebuffer_available:
+                    self._blank_framebuffer()
 
             # Clear OLED display
-            if self.oled_available and self.oled is not None:
-                self.oled.fill(0)
-                self.oled.show()
+            with self._oled_lock:
+                self._oled_frames.discard()
+                if self.oled_available and self.oled is not None:
+                    self._oled_canvas()
+                    self._oled_push()
         except Exception as e:
             logging.error(f"Error clearing displays: {e}")
 
     def cleanup(self):
         """Clean up display resources"""
+        self._tft_frames.stop()
+        self._oled_frames.stop()
         try:
             # Clean up ST7789 display
             if self.st7789_available:
@@ -1563,13 +3052,7 @@ class DisplayManager:
                         and self.rgb_display is not None
                     ):
                         try:
-                            black_image = Image.new(
-                                "RGB", (self.width, self.height), color=(0, 0, 0)
-                            )
-                            try:
-                                self.rgb_display.image(black_image)
-                            except Exception:
-                                self.rgb_display.display(black_image)
+                            self._blank_rgb_panel()
                         except Exception:
                             pass
                     self.st7789_display = None
@@ -1578,6 +3061,12 @@ class DisplayManager:
                 except Exception as e:
                     logging.debug(f"Error cleaning up ST7789 display: {e}")
 
+            self._close_pulse()
+
+            # Release the framebuffer mapping for good (no reopen after cleanup)
+            self._fb_wanted = False
+            self._close_framebuffer()
+
         except Exception as e:
             logging.error(f"Error in DisplayManager cleanup: {e}")
 
@@ -1591,69 +3080,63 @@ class DisplayManager:
     def show_message(self, title, message, duration=3):
         """Show a temporary message on both displays"""
         # Note: duration parameter reserved for future use
+        # The message replaces the status frames, so the next update() must redraw both
+        self._last_oled_key = None
         try:
-            # ST7789 message
-            if self.st7789_available:
-                try:
-                    # Create message image
-                    img = Image.new('RGB', (self.width, self.height), color=(0, 0, 0))
-                    draw = ImageDraw.Draw(img)
-
-                    # Title (centered, orange)
-                    title_bbox = draw.textbbox(
-                        (0, 0), title, font=(self._font_bold_large or self.font_large)
-                    )
-                    title_width = title_bbox[2] - title_bbox[0]
-                    title_x = (self.width - title_width) // 2
-                    draw.text(
-                        (title_x, 100),
-                        title,
-                        fill=(255, 165, 0),
-                        font=(self._font_bold_large or self.font_large),
-                    )
-
-                    # Message (centered, white)
-                    msg_bbox = draw.textbbox(
-                        (0, 0), message, font=(self._font_regular_med or self.font_med)
-                    )
-                    msg_width = msg_bbox[2] - msg_bbox[0]
-                    msg_x = (self.width - msg_width) // 2
-                    draw.text(
-                        (msg_x, 140),
-                        message,
-                        fill=(255, 255, 255),
-                        font=(self._font_regular_med or self.font_med),
-                    )
-
-                    # Display the message on RGB driver if available; otherwise attempt displayio or save
-                    if (
-                        getattr(self, "rgb_display_available", False)
-                        and self.rgb_display is not None
-                    ):
-                        try:
+            # ST7789 / framebuffer message (under the TFT lock so the worker cannot draw over it)
+            with self._tft_lock:
+                self._tft_frames.discard()
+                self._last_tft_key = None
+                self._mark_tft_dirty(0, self.height)
+                if self.st7789_available or self._framebuffer_available:
+                    try:
+                        # Compose the message on the reusable frame
+                        img = self._blank_tft_scratch()
+
+                        # Banners recur, so their widths and rasterized text come from the
+                        # shared caches; pasting a color through the mask matches draw.text()
+                        # Title (centered, orange)
+                        title_font = self._font_bold_large or self.font_large
+                        title_x = (self.width - _text_width(title, title_font)) // 2
+                        mask, (dx, dy) = _text_mask(title, title_font)
+                        img.paste((255, 165, 0), (title_x + dx, 100 + dy), mask)
+
+                        # Message (centered, white)
+                        msg_font = self._font_regular_med or self.font_med
+                        msg_x = (self.width - _text_width(message, msg_font)) // 2
+                        mask, (dx, dy) = _text_mask(message, msg_font)
+                        img.paste((255, 255, 255), (msg_x + dx, 140 + dy), mask)
+
+                        # Display the message on RGB driver if available; otherwise attempt displayio or save
+                        if (
+                            getattr(self, "rgb_display_available", False)
+                            and self.rgb_display is not None
+                        ):
                             try:
-                                self.rgb_display.image(img)
+                                self._show_rgb_frame(img)
                             except Exception:
-                                self.rgb_display.display(img)
-                        except Exception:
-                            pass
-                    elif self.st7789_display is not None:
-                        try:
-                            self.st7789_display.display(img)
-                        except Exception:
-                            pass
-                    else:
-                        img.save(self.image_path)
+                                pass
+                        elif self.st7789_display is not None:
+                            try:
+                                self.st7789_display.display(img)
+                            except Exception:
+                                pass
+                        elif self._framebuffer_available:
+                            self._blit_framebuffer(img)
+                        if self._save_debug_image:
+                            img.save(self.image_path, "BMP")
 
-                except Exception as e:
-                    logging.debug(f"Error preparing ST7789 message: {e}")
+                    except Exception as e:
+                        logging.debug(f"Error preparing ST7789 message: {e}")
 
             # OLED message
-            if self.oled_available and self.oled is not None:
-                self.oled.fill(0)
-                self.oled.text(title[:21], 0, 10, 1)
-                self.oled.text(message[:21], 0, 30, 1)
-                self.oled.show()
+            with self._oled_lock:
+                self._oled_frames.discard()
+                if self.oled_available and self.oled is not None:
+                    self._oled_canvas()
+                    self._oled_text(title[:_OLED_LINE_CHARS], 0, 10, 1)
+                    self._oled_text(message[:_OLED_LINE_CHARS], 0, 30, 1)
+                    self._oled_push()
 
         except Exception as e:
             logging.error(f"Error showing message: {e}")
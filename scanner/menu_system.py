@@ -516,8 +516,8 @@ class MenuSystem:
                         text = f"{prefix}{item}"
                     
                     self.display.oled.text(text[:21], 0, (i + 1) * 10, 1)
-                
-        self.display.oled.show()
+
+                self.display.oled.show()
 
     def current_menu(self):
         """Get the current menu items"""
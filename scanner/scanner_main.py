@@ -65,7 +65,12 @@ def main():
 
         # Initialize display with talkgroup manager and rotation setting
         rotation = settings.get("display_rotation", 0)
-        display = DisplayManager(talkgroup_manager=talkgroup_mgr, rotation=rotation)
+        try:
+            oled_i2c_hz = int(settings.get("i2c_frequency_khz", 1000)) * 1000
+        except (TypeError, ValueError):
+            logging.warning(f"Invalid i2c_frequency_khz {settings.get('i2c_frequency_khz')!r}, using 1000")
+            oled_i2c_hz = 1_000_000
+        display = DisplayManager(talkgroup_manager=talkgroup_mgr, rotation=rotation, oled_i2c_hz=oled_i2c_hz)
 
         # Initialize ST7789 display with configured pins
         display.init_st7789(settings)
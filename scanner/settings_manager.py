@@ -51,6 +51,10 @@ class SettingsManager:
             "tft_font_tgid_size": 28,
             # Preferred ST7789 driver for TFT: 'displayio' (default) or 'rgb'
             "tft_driver": "displayio",
+            # 'rgb' driver: send each TFT window in one SPI transaction instead of via _block()
+            "tft_direct_spi": True,
+            # OLED I2C clock; drops to 400 kHz if the panel errors at it
+            "i2c_frequency_khz": 1000,
         }
         self.load()
 
@@ -7,6 +7,8 @@ class TalkgroupManager:
     def __init__(self, filepath):
         self.filepath = filepath
         self.talkgroups = {}
+        # Bumped whenever the table changes, so callers can cache lookups
+        self.version = 0
         self.load()
         
     def load(self):
@@ -68,6 +70,7 @@ class TalkgroupManager:
                         'name': name,
                     }
                         
+            self.version += 1
             logging.info(f"Loaded {len(self.talkgroups)} talkgroups")
             
         except Exception as e:
@@ -116,6 +119,7 @@ class TalkgroupManager:
                 'description': description,
                 'priority': priority
             }
+            self.version += 1
             self.save()
             return True
         except (ValueError, TypeError):
@@ -17,6 +17,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
 from scanner.settings_manager import SettingsManager
 from scanner.talkgroup_manager import TalkgroupManager
 from scanner.op25_client import OP25Client
+import kill_op25
+from scanner import display_manager
 
 
 def test_settings_manager():
@@ -170,6 +172,494 @@ def test_op25_client():
     print("✓ OP25 Client tests passed")
 
 
+def test_op25_process_matching():
+    """Test OP25 cmdline matching used by kill_op25"""
+    print("Testing OP25 Process Matching...")
+
+    # Raw /proc/<pid>/cmdline contents are NUL-separated
+    assert kill_op25._OP25_RE.search(b"python3\x00multi_rx.py\x00-c\x00cfg.json\x00")
+    assert kill_op25._OP25_RE.search(b"python3\x00/home/pi/op25/apps/rx.py\x00")
+    assert not kill_op25._OP25_RE.search(b"bash\x00-c\x00echo multi_rx.py done\x00")
+    assert not kill_op25._OP25_RE.search(b"python3\x00rx.pyc\x00")
+
+    # Matches come back as psutil.Process objects, bound to the process before any prompt
+    import subprocess
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)", "rx.py"])
+    try:
+        matches = {proc.pid: proc for proc, _ in kill_op25.find_all_op25_processes()}
+        assert child.pid in matches
+        assert matches[child.pid].create_time() == kill_op25.psutil.Process(child.pid).create_time()
+    finally:
+        child.kill()
+        child.wait()
+
+    print("✓ OP25 process matching tests passed")
+
+
+def test_frame_worker():
+    """Test frame coalescing and shutdown of the display worker threads"""
+    print("Testing Frame Worker...")
+    import threading
+
+    rendered = []
+    started, release = threading.Event(), threading.Event()
+
+    def render(n):
+        rendered.append(n)
+        started.set()
+        release.wait(5)
+
+    worker = display_manager._FrameWorker("test-worker", render)
+    worker.submit((1,))
+    assert started.wait(5)
+    # While frame 1 renders, later frames replace each other in the one-slot queue
+    for n in range(2, 6):
+        worker.submit((n,))
+    release.set()
+    worker.join()
+    assert rendered == [1, 5]
+
+    # discard() under the lock drops a frame that has not been rendered yet
+    with worker.lock:
+        worker.submit((6,))
+        worker.discard()
+    worker.submit((7,))
+    worker.join()
+    assert rendered == [1, 5, 7]
+
+    # After stop() the worker stays down: submits are ignored, no thread is started
+    worker.stop()
+    worker.submit((8,))
+    assert worker._thread is None
+    assert not any(t.name == "test-worker" for t in threading.enumerate())
+    assert rendered == [1, 5, 7]
+
+    print("✓ Frame worker tests passed")
+
+
+def test_display_frame_key():
+    """Test that talkgroup table edits invalidate the display frame key and lookup"""
+    print("Testing Display Frame Key...")
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.tsv', delete=False) as f:
+        f.write("TGID\tDepartment\tDescription\tPriority\n")
+        f.write("1\tPolice\tPolice Dispatch\tHigh\n")
+        talkgroups_file = f.name
+
+    try:
+        tg_mgr = TalkgroupManager(talkgroups_file)
+        display = display_manager.DisplayManager(talkgroup_manager=tg_mgr)
+        display._get_volume_percent = lambda settings=None, ttl=None: 50
+        extra = {"active": True, "srcaddr": 7}
+
+        snap = display._snapshot({}, 1, extra)
+        key = display._frame_key("SYS", 460.5, 1, snap.ev, snap.sv)
+        assert display._frame_key("SYS", 460.5, 1, snap.ev, snap.sv) == key
+
+        # Same talkgroup on screen, edited table: new key and a fresh lookup
+        assert tg_mgr.add_talkgroup(1, "Fire", "Fire Dispatch", "High")
+        snap = display._snapshot({}, 1, extra)
+        assert display._frame_key("SYS", 460.5, 1, snap.ev, snap.sv) != key
+        assert snap.tg_info['department'] == 'Fire'
+        display.cleanup()
+    finally:
+        os.unlink(talkgroups_file)
+
+    print("✓ Display frame key tests passed")
+
+
+def test_tft_dirty_boxes():
+    """Test dirty-box merging and the canvas box -> panel window origin per rotation"""
+    print("Testing TFT Dirty Boxes...")
+    display = display_manager.DisplayManager()
+    gap = display_manager._TFT_SPAN_MERGE_GAP
+
+    display._tft_dirty = None
+    display._mark_tft_dirty(0, 28, 0, 70)
+    display._mark_tft_dirty(300, 320)
+    assert display._tft_dirty == [(0, 0, 70, 28), (0, 300, 240, 320)]
+    # Rows within the merge gap join the box above, taking the union of both
+    display._mark_tft_dirty(28 + gap, 60, 10, 50)
+    assert display._tft_dirty == [(0, 0, 70, 60), (0, 300, 240, 320)]
+    display._mark_tft_dirty(100, 120)
+    assert display._tft_dirty == [(0, 0, 70, 60), (0, 100, 240, 120), (0, 300, 240, 320)]
+
+    # Panel-native origin of canvas box (10, 20)-(50, 60) on a 240x320 panel
+    box = (10, 20, 50, 60)
+    expected = {0: (10, 20), 180: (190, 260), 90: (20, 270), 270: (180, 10)}
+    for rotation, origin in expected.items():
+        display.set_rotation(rotation)
+        assert display._rgb_region_origin(box) == origin, rotation
+    display.cleanup()
+
+    print("✓ TFT dirty box tests passed")
+
+
+def _ref_rgb565(img, big_endian):
+    """Reference RGB565 encoder: one pixel at a time, straight from the datasheet packing"""
+    order = "big" if big_endian else "little"
+    out = bytearray()
+    for r, g, b in img.convert("RGB").getdata():
+        out += (((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)).to_bytes(2, order)
+    return bytes(out)
+
+
+class _FakeST7789:
+    """ST7789 stand-in: decodes CASET/RASET/RAMWR, from _block() or from raw SPI bytes, into GRAM"""
+
+    _COLUMN_SET, _PAGE_SET, _RAM_WRITE = 0x2A, 0x2B, 0x2C
+    _X_START = _Y_START = 0
+
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+        self.gram = bytearray(width * height * 2)
+        self.windows = 0
+        self.largest_write = 0
+        self.command = None
+        # spi_device and dc_pin, as on adafruit_rgb_display drivers
+        self.spi_device = self
+        self.dc_pin = self
+        self.value = 0
+
+    def _encode_pos(self, a, b):
+        return a.to_bytes(2, "big") + b.to_bytes(2, "big")
+
+    def _block(self, x0, y0, x1, y1, data):
+        assert 0 <= x0 <= x1 < self.width and 0 <= y0 <= y1 < self.height, (x0, y0, x1, y1)
+        data = bytes(data)
+        row = (x1 - x0 + 1) * 2
+        assert len(data) == row * (y1 - y0 + 1)
+        for i, y in enumerate(range(y0, y1 + 1)):
+            start = (y * self.width + x0) * 2
+            self.gram[start:start + row] = data[i * row:(i + 1) * row]
+        self.windows += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write(self, data):
+        # D/C low: command byte; D/C high: its parameters
+        data = bytes(data)
+        self.largest_write = max(self.largest_write, len(data))
+        if self.value == 0:
+            self.command = data[0]
+            if self.command == self._RAM_WRITE:
+                self.pending = bytearray()
+            return
+        if self.command == self._COLUMN_SET:
+            self.cols = (int.from_bytes(data[:2], "big"), int.from_bytes(data[2:4], "big"))
+        elif self.command == self._PAGE_SET:
+            self.rows = (int.from_bytes(data[:2], "big"), int.from_bytes(data[2:4], "big"))
+        elif self.command == self._RAM_WRITE:
+            self.pending += data
+            (x0, x1), (y0, y1) = self.cols, self.rows
+            if len(self.pending) == (x1 - x0 + 1) * (y1 - y0 + 1) * 2:
+                self._block(x0, y0, x1, y1, self.pending)
+
+
+_DISPLAY_STATES = [
+    ("SYS", 460.55, None, {"signal_quality": 0.3}),
+    ("SYS", 460.55, 119, {"signal_quality": 0.5, "signal_locked": 1, "active": True, "srcaddr": 12, "nac": 1}),
+    ("SYS", 460.55, 119, {"signal_quality": 0.5, "signal_locked": 1, "active": True, "srcaddr": 13, "nac": 1}),
+    ("OTHER", 461.0, 2001, {"signal_quality": 0.9, "encrypted": True, "active": True, "nac": 2}),
+]
+
+
+def test_tft_spi_push():
+    """Test direct SPI window writes: GRAM matches the rotated canvas, writes fit spidev's bufsiz"""
+    print("Testing TFT SPI Push...")
+    import time
+
+    for rotation in (0, 90, 180, 270):
+        display = display_manager.DisplayManager()
+        display._get_volume_percent = lambda settings=None, ttl=None: 42
+        display.set_rotation(rotation)
+        panel = _FakeST7789(display._panel_native_width, display._panel_native_height)
+        display.rgb_display = panel
+        display.rgb_display_available = display.st7789_available = True
+        # As init_st7789() sets it from a 4096-byte spidev bufsiz
+        display._spi_chunk = 4096
+        assert display._rgb_block_writer() == display._spi_block
+
+        for state in _DISPLAY_STATES:
+            display.update_tft(*state, {"tft_update_interval": 0})
+            time.sleep(0.002)
+            # adafruit_rgb_display.image() rotates with PIL before writing the window
+            expected = display._tft_img.rotate(rotation, expand=True)
+            assert bytes(panel.gram) == _ref_rgb565(expected, True), (rotation, state)
+        # Later frames go out as partial windows, each write within one spidev buffer
+        assert panel.windows > len(_DISPLAY_STATES)
+        assert panel.largest_write == 4096
+
+        display.show_message("Title", "Message body")
+        expected = display._tft_scratch.rotate(rotation, expand=True)
+        assert bytes(panel.gram) == _ref_rgb565(expected, True)
+        display.clear()
+        assert not any(panel.gram)
+        display.cleanup()
+
+    print("✓ TFT SPI push tests passed")
+
+
+def _ref_xrgb8888(img):
+    """Reference 32 bpp fbdev encoder (little-endian XRGB8888: B, G, R, X bytes)"""
+    return b"".join(bytes((b, g, r, 0)) for r, g, b in img.convert("RGB").getdata())
+
+
+def test_rgb565_encoders():
+    """Test the RGB565 / framebuffer encoders on RGB, RGBA and gray images, with and without NumPy"""
+    print("Testing RGB565 Encoders...")
+    from PIL import Image
+
+    rgb = Image.new("RGB", (37, 11))
+    rgb.putdata([((i * 7) % 256, (i * 13) % 256, (i * 29) % 256) for i in range(37 * 11)])
+    gray = Image.new("L", (37, 11))
+    gray.putdata([(i * 11) % 256 for i in range(37 * 11)])
+    images = (rgb, rgb.convert("RGBA"), gray)
+
+    numpy = display_manager.np
+    if numpy is not None:
+        for img in images:
+            assert display_manager._fb_pixel_values(img, 16).astype("<u2").tobytes() == _ref_rgb565(img, False)
+            assert display_manager._fb_pixel_values(img, 32).astype("<u4").tobytes() == _ref_xrgb8888(img)
+    try:
+        for np_module in {numpy, None}:
+            display_manager.np = np_module
+            for img in images:
+                for big_endian in (False, True):
+                    assert display_manager._rgb565_bytes(img, big_endian) == _ref_rgb565(img, big_endian)
+    finally:
+        display_manager.np = numpy
+
+    print("✓ RGB565 encoder tests passed")
+
+
+def test_tft_block_push():
+    """Test TFT pushes through the driver's _block(): GRAM matches the rotated canvas"""
+    print("Testing TFT Block Push...")
+    import time
+
+    for rotation in (0, 90, 180, 270):
+        display = display_manager.DisplayManager()
+        display._get_volume_percent = lambda settings=None, ttl=None: 42
+        display.set_rotation(rotation)
+        panel = _FakeST7789(display._panel_native_width, display._panel_native_height)
+        display.rgb_display = panel
+        display.rgb_display_available = display.st7789_available = True
+        display._tft_direct_spi = False
+        assert display._rgb_block_writer() == panel._block
+
+        for state in _DISPLAY_STATES:
+            display.update_tft(*state, {"tft_update_interval": 0})
+            time.sleep(0.002)
+            expected = display._tft_img.rotate(rotation, expand=True)
+            assert bytes(panel.gram) == _ref_rgb565(expected, True), (rotation, state)
+
+        # Message banners are RGB frames rather than gray canvas boxes
+        display.show_message("Title", "Message body")
+        expected = display._tft_scratch.rotate(rotation, expand=True)
+        assert bytes(panel.gram) == _ref_rgb565(expected, True)
+        display.cleanup()
+
+    print("✓ TFT block push tests passed")
+
+
+def test_framebuffer_padded_stride():
+    """Test framebuffer writes (NumPy view and byte rows) when the line length exceeds the row"""
+    print("Testing Framebuffer Padded Stride...")
+    import time
+
+    geometry = display_manager._framebuffer_geometry
+    numpy = display_manager.np
+    try:
+        for bpp in (16, 32):
+            row = 240 * bpp // 8
+            stride = row + 64
+            display_manager._framebuffer_geometry = lambda fd: (240, 320, bpp, stride)
+            for np_module in {numpy, None}:
+                display_manager.np = np_module
+                with tempfile.NamedTemporaryFile(suffix='.fb', delete=False) as f:
+                    f.write(bytes(stride * 320))
+                    fb_path = f.name
+                try:
+                    display = display_manager.DisplayManager()
+                    display._get_volume_percent = lambda settings=None, ttl=None: 42
+                    display._fb_path = fb_path
+                    display.init_st7789({})
+                    assert display._framebuffer_available
+                    assert (display._fb_pixels is not None) == (np_module is not None)
+
+                    for state in _DISPLAY_STATES:
+                        display.update_tft(*state, {"tft_update_interval": 0})
+                        time.sleep(0.002)
+                        with open(fb_path, "rb") as fb:
+                            data = fb.read()
+                        pixels = b"".join(data[y * stride:y * stride + row] for y in range(320))
+                        if bpp == 16:
+                            assert pixels == _ref_rgb565(display._tft_img, False), (np_module, state)
+                        else:
+                            assert pixels == _ref_xrgb8888(display._tft_img), (np_module, state)
+                        # The padding past each row is never written
+                        assert not any(any(data[y * stride + row:(y + 1) * stride]) for y in range(320))
+
+                    display.clear()
+                    with open(fb_path, "rb") as fb:
+                        assert not any(fb.read())
+                    display.cleanup()
+                finally:
+                    os.unlink(fb_path)
+    finally:
+        display_manager._framebuffer_geometry = geometry
+        display_manager.np = numpy
+
+    print("✓ Framebuffer padded stride tests passed")
+
+
+def _ref_mono_vlsb(img):
+    """Reference SSD1306 packing: page-major, bit n of each byte is row 8 * page + n"""
+    px = img.load()
+    return bytes(
+        sum(1 << bit for bit in range(8) if px[x, page * 8 + bit])
+        for page in range(img.height // 8) for x in range(img.width)
+    )
+
+
+class _FakeSSD1306Bus:
+    """I2C device stand-in for an SSD1306 in horizontal addressing mode, modelling GDDRAM"""
+
+    def __init__(self):
+        self.ram = bytearray(1024)
+        self.window = (0, 127, 0, 7)
+        self.pointer = (0, 0)
+        self.data_bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write(self, data, start=0, end=None):
+        data = bytes(data[start:end])
+        if data[0] == 0x00:
+            # Command stream: column (0x21) and page (0x22) address windows
+            cmds, i = data[1:], 0
+            while i < len(cmds):
+                if cmds[i] == 0x21:
+                    self.window = (cmds[i + 1], cmds[i + 2]) + self.window[2:]
+                    i += 3
+                elif cmds[i] == 0x22:
+                    self.window = self.window[:2] + (cmds[i + 1], cmds[i + 2])
+                    i += 3
+                else:
+                    i += 1
+            self.pointer = (self.window[0], self.window[2])
+            return
+        assert data[0] == 0x40
+        x, page = self.pointer
+        for value in data[1:]:
+            self.ram[page * 128 + x] = value
+            self.data_bytes += 1
+            x += 1
+            if x > self.window[1]:
+                x, page = self.window[0], page + 1
+                if page > self.window[3]:
+                    page = self.window[2]
+        self.pointer = (x, page)
+
+
+class _FakeSSD1306:
+    """adafruit_ssd1306.SSD1306_I2C attributes the page-run writer uses"""
+
+    def __init__(self):
+        self.buffer = bytearray(1025)
+        self.buffer[0] = 0x40
+        self.buf = memoryview(self.buffer)[1:]
+        self.i2c_device = _FakeSSD1306Bus()
+        self.page_addressing = False
+
+
+def test_oled_page_runs():
+    """Test that SSD1306 page-run pushes keep the panel GDDRAM equal to the canvas"""
+    print("Testing OLED Page Runs...")
+
+    numpy = display_manager.np
+    try:
+        for np_module in {numpy, None}:
+            display_manager.np = np_module
+            display = display_manager.DisplayManager()
+            display._get_volume_percent = lambda settings=None, ttl=None: 42
+            display.oled = _FakeSSD1306()
+            display.oled_available = True
+            bus = display.oled.i2c_device
+
+            for state in _DISPLAY_STATES + [("Offline", 0, None, {})]:
+                display.request_oled_refresh()
+                display.update_oled(*state, {})
+                assert bytes(bus.ram) == _ref_mono_vlsb(display._oled_img), (np_module, state)
+                assert bytes(display.oled.buf) == bytes(bus.ram)
+
+            # Only the pages that changed go out; an identical frame sends nothing
+            sent = bus.data_bytes
+            display.request_oled_refresh()
+            display.update_oled("Offline", 0, None, {}, {})
+            assert bus.data_bytes == sent
+            display._oled_img.paste(1, (0, 40, 128, 48))
+            display._oled_push()
+            assert bus.data_bytes - sent == 128
+            assert bytes(bus.ram) == _ref_mono_vlsb(display._oled_img)
+
+            display.clear()
+            assert not any(bus.ram)
+            display.cleanup()
+    finally:
+        display_manager.np = numpy
+
+    print("✓ OLED page run tests passed")
+
+
+def test_oled_menu_frames():
+    """Test that menu frames are drawn and sent by the OLED worker, coalescing to the newest"""
+    print("Testing OLED Menu Frames...")
+    menu = ["Volume", "Squelch", "Brightness", "Talkgroups", "Exit"]
+
+    display = display_manager.DisplayManager()
+    display._get_volume_percent = lambda settings=None, ttl=None: 42
+    display.oled = _FakeSSD1306()
+    display.oled_available = True
+    bus = display.oled.i2c_device
+    drawn = []
+    draw_menu = display._draw_menu_on_oled
+
+    def record_menu(menu_items, selected_index):
+        drawn.append(selected_index)
+        draw_menu(menu_items, selected_index)
+
+    display._draw_menu_on_oled = record_menu
+    display.update_oled(*_DISPLAY_STATES[1], {})
+    # Fast scrolling while the worker is busy: only the newest menu is left to draw
+    with display._oled_frames.lock:
+        for index in range(len(menu)):
+            display.show_menu_on_oled(menu, index)
+    display._oled_frames.join()
+    assert drawn[-1] == len(menu) - 1 and len(drawn) <= 2, drawn
+    assert bytes(bus.ram) == _ref_mono_vlsb(display._oled_img)
+
+    # Same pixels as drawing that menu directly on a fresh canvas
+    reference = display_manager.DisplayManager()
+    reference.oled = _FakeSSD1306()
+    reference.oled_available = True
+    reference._draw_menu_on_oled(menu, len(menu) - 1)
+    assert bytes(bus.ram) == bytes(reference.oled.i2c_device.ram)
+    reference.cleanup()
+    display.cleanup()
+
+    print("✓ OLED menu frame tests passed")
+
+
 def test_configuration_files():
     """Test that configuration files are valid"""
     print("Testing Configuration Files...")
@@ -204,6 +694,16 @@ def main():
         test_settings_manager()
         test_talkgroup_manager()
         test_op25_client()
+        test_op25_process_matching()
+        test_frame_worker()
+        test_display_frame_key()
+        test_tft_dirty_boxes()
+        test_tft_spi_push()
+        test_rgb565_encoders()
+        test_tft_block_push()
+        test_framebuffer_padded_stride()
+        test_oled_page_runs()
+        test_oled_menu_frames()
         test_configuration_files()
         
         print("\n" + "=" * 40)